@@ -15,9 +15,11 @@ import time
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
+import lxml.html
 import pypdf
 import requests
 import trafilatura
+from lxml import etree
 
 
 @dataclass
@@ -67,6 +69,19 @@ PAYWALL_DOMAINS = [
 ]
 
 
+# Elements that never hold article body text (dropped before fast extraction)
+BOILERPLATE_XPATH = "//script|//style|//noscript|//nav|//header|//footer|//aside|//form"
+
+# Fast-path extraction must yield at least this much text to be trusted
+FAST_EXTRACT_MIN_CHARS = 500
+FAST_EXTRACT_MIN_ALNUM_RATIO = 0.5
+# Containers where more than this share of the text is link text are navigation, not article body
+FAST_EXTRACT_MAX_LINK_DENSITY = 0.3
+
+# Extraction only looks at this much of a page; anything past it is almost always scripts or markup
+MAX_EXTRACT_INPUT_CHARS = 2_000_000
+
+
 def _generate_fetch_id(url: str) -> str:
     """Generate a short unique ID for a URL."""
     return hashlib.md5(url.encode()).hexdigest()[:8]
@@ -109,6 +124,68 @@ def _detect_paywall(text: str, url: str) -> bool:
     return False
 
 
+def _fast_extract(html: str | bytes) -> str | None:
+    """Cheap lxml extraction for well-structured pages.
+
+    Takes text from the largest <article>, else the largest <main>. Returns None
+    for pages without either, or if the result doesn't look like article body
+    text, so the caller can fall back to trafilatura, which is better at
+    separating body text from nav, sidebars and comments.
+    """
+    try:
+        tree = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+    for element in tree.xpath(BOILERPLATE_XPATH):
+        element.drop_tree()
+
+    candidates = tree.xpath("//article") or tree.xpath("//main")
+    if not candidates:
+        return None
+    container = max(candidates, key=lambda el: len(el.text_content()))
+
+    container_chars = len(container.text_content())
+    link_chars = sum(len(link.text_content()) for link in container.iter("a"))
+    if not container_chars or link_chars / container_chars > FAST_EXTRACT_MAX_LINK_DENSITY:
+        return None
+
+    # Prefer paragraph text; fall back to the container's full text
+    paragraphs = [" ".join(p.text_content().split()) for p in container.iter("p")]
+    text = "\n".join(p for p in paragraphs if p) or " ".join(container.text_content().split())
+
+    if len(text) < FAST_EXTRACT_MIN_CHARS:
+        return None
+    alnum = sum(1 for c in text if c.isalnum())
+    if alnum / len(text) < FAST_EXTRACT_MIN_ALNUM_RATIO:
+        return None
+    return text
+
+
+def extract_article_text(html: str | bytes, include_tables: bool = True) -> str | None:
+    """Extract main article text from downloaded HTML.
+
+    Tries the cheap lxml fast path first, then trafilatura without its
+    fallback extractors, and only runs trafilatura's full extraction
+    cascade when both fail.
+
+    Args:
+        html: Downloaded page content
+        include_tables: Whether trafilatura should keep table text
+
+    Returns:
+        Extracted text, or None if nothing could be extracted
+    """
+    html = html[:MAX_EXTRACT_INPUT_CHARS]
+    text = _fast_extract(html)
+    if text:
+        return text
+    text = trafilatura.extract(html, fast=True, include_comments=False, include_tables=include_tables)
+    if text:
+        return text
+    return trafilatura.extract(html, include_comments=False, include_tables=include_tables)
+
+
 def _fetch_web_article(url: str, timeout: int = 15) -> tuple[str, str | None]:
     """Fetch and extract text from a web article.
 
@@ -132,9 +209,9 @@ def _fetch_web_article(url: str, timeout: int = 15) -> tuple[str, str | None]:
     )
     response.raise_for_status()
 
-    # Extract text and metadata using trafilatura
+    # Extract text (fast path first, trafilatura fallback) and metadata
     downloaded = response.content
-    text = trafilatura.extract(downloaded, include_comments=False, include_tables=True)
+    text = extract_article_text(downloaded, include_tables=True)
 
     if not text:
         raise ValueError("Could not extract text from URL")
@@ -1,16 +1,17 @@
 """Generate debate cases using the Anthropic API."""
 
+import functools
 import json
 from pathlib import Path
 
-import anthropic
-
+from debate.client import get_client, print_stream
 from debate.config import Config
 from debate.models import Case, Contention, EvidenceBucket, Side
 
 
+@functools.lru_cache(maxsize=32)
 def load_prompt_template(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (read once per process)."""
     prompts_dir = Path(__file__).parent / "prompts"
     template_path = prompts_dir / f"{name}.md"
     return template_path.read_text()
@@ -35,7 +36,7 @@ def generate_case(
     Returns:
         A Case object with 2-3 contentions
     """
-    client = anthropic.Anthropic()
+    client = get_client()
 
     # Choose template based on whether we have evidence
     if evidence_buckets:
@@ -69,15 +70,12 @@ def generate_case(
 
     if stream:
         # Stream the response
-        response_text = ""
         with client.messages.stream(
             model=model,
             max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}],
         ) as stream_response:
-            for text in stream_response.text_stream:
-                print(text, end="", flush=True)
-                response_text += text
+            response_text = print_stream(stream_response.text_stream)
         print()  # Add newline after streaming
     else:
         # Non-streaming response
@@ -107,8 +105,7 @@ def _format_evidence_buckets(buckets: list[EvidenceBucket]) -> str:
         lines.append(f"### {bucket.topic}\n")
 
         for i, card in enumerate(bucket.cards, 1):
-            last_name = card.author.split()[-1]
-            lines.append(f"{i}. **{card.tag}** ({last_name} {card.year})")
+            lines.append(f"{i}. **{card.tag}** ({card.last_name} {card.year})")
             lines.append(f"   - Author: {card.author}, {card.credentials}")
             lines.append(f"   - Source: {card.source}, {card.year}")
             if card.url:
@@ -44,8 +44,7 @@ def cmd_generate(args) -> None:
 
         sections = debate_file.get_sections_for_side(side)
         for section in sections:
-            cards = [debate_file.get_card(card_id) for card_id in section.card_ids]
-            cards = [c for c in cards if c is not None]
+            cards = [c for c in debate_file.get_cards(section.card_ids) if c is not None]
             bucket = EvidenceBucket(
                 topic=section.argument,
                 resolution=args.resolution,
@@ -120,8 +119,7 @@ def cmd_research(args) -> None:
                 print(f"\n{'=' * 60}")
                 print(f"{section.get_heading()}")
                 print("=" * 60)
-                for card_id in section.card_ids:
-                    card = debate_file.get_card(card_id)
+                for card_id, card in zip(section.card_ids, debate_file.get_cards(section.card_ids), strict=True):
                     if card:
                         print(f"\n[{card_id}] {card.tag}")
                         if card.purpose:
@@ -0,0 +1,57 @@
+"""Shared Anthropic API client and streaming helpers."""
+
+import functools
+import sys
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import anthropic
+
+# Streamed text is flushed to stdout after this many characters or seconds, whichever comes first
+_STREAM_FLUSH_CHARS = 64
+_STREAM_FLUSH_SECONDS = 0.016
+
+
+@functools.cache
+def get_client() -> "anthropic.Anthropic":
+    """Return the process-wide Anthropic client, creating it on first use.
+
+    Sharing one client lets every agent reuse the same pool of keep-alive
+    HTTPS connections instead of each paying its own connection setup.
+    The API key is read from the environment when the client is created.
+    """
+    # Imported here: the SDK takes about a second to import, which CLI
+    # commands that never call the API shouldn't pay
+    import anthropic
+
+    return anthropic.Anthropic()
+
+
+def print_stream(text_stream: Iterable[str]) -> str:
+    """Echo streamed response text to stdout as it arrives and return the full text.
+
+    Writes are batched: stdout is flushed once enough text has accumulated or
+    enough time has passed, rather than once per token. The output still looks
+    live to a reader.
+    """
+    parts: list[str] = []
+    pending: list[str] = []
+    pending_chars = 0
+    last_flush = time.monotonic()
+    for text in text_stream:
+        parts.append(text)
+        pending.append(text)
+        pending_chars += len(text)
+        now = time.monotonic()
+        if pending_chars >= _STREAM_FLUSH_CHARS or now - last_flush >= _STREAM_FLUSH_SECONDS:
+            sys.stdout.write("".join(pending))
+            sys.stdout.flush()
+            pending.clear()
+            pending_chars = 0
+            last_flush = now
+    if pending:
+        sys.stdout.write("".join(pending))
+        sys.stdout.flush()
+    return "".join(parts)
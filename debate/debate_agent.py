@@ -1,37 +1,343 @@
 """A generally capable debate agent that can research, generate cases, and deliver speeches."""
 
+import functools
+import hashlib
+import io
+import itertools
 import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import anthropic
+import trafilatura
 
+from debate.article_fetcher import extract_article_text
 from debate.case_generator import generate_case as _generate_case
-from debate.evidence_storage import load_debate_file
+from debate.client import get_client, print_stream
+from debate.config import Config
+from debate.evidence_storage import (
+    FlatDebateFileWriter,
+    _write_text_atomic,
+    append_flat_debate_cards,
+    get_or_create_flat_debate_file,
+    load_debate_file,
+)
 from debate.models import (
     AnalysisResult,
     AnalysisType,
+    ArgumentFile,
     ArgumentPrep,
     Card,
     Case,
     DebateFile,
+    EvidenceBucket,
+    EvidenceType,
     FlatDebateFile,
     PrepFile,
     ResearchEntry,
     RoundState,
     SectionType,
     Side,
+    Speech,
 )
+from debate.research_agent import _brave_search
 from debate.research_agent import research_evidence as _research_evidence
 
-
+if TYPE_CHECKING:
+    from anthropic.types import Message, Usage
+
+# Tool-input evidence_type strings -> EvidenceType
+_EVIDENCE_TYPE_MAP: dict[str, EvidenceType] = {evidence_type.value: evidence_type for evidence_type in EvidenceType}
+
+# Shortest start_phrase cut_card will search for
+_MIN_START_PHRASE_CHARS = 10
+
+# Fetched article text is kept on disk here rather than in memory, one file per fetch_id
+FETCH_CACHE_DIR = Path(".fetch_cache")
+
+# Extracted article text by URL, reused by later fetches (in any session) until it is a week old
+_URL_CACHE_DIR = FETCH_CACHE_DIR / "urls"
+_URL_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# Past this total size, the least recently written URL cache entries are deleted
+_URL_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# How many exact-match responses each agent remembers (see DebateAgent._respond)
+_RESPONSE_CACHE_SIZE = 256
+
+# Prior speeches fit in a speech prompt verbatim up to about this many tokens; past it, the middle is summarized
+_SPEECH_CONTEXT_TOKEN_BUDGET = 12_000
+
+# Rough characters-per-token ratio for English text
+_CHARS_PER_TOKEN = 4
+
+# Most prep tool calls from one model turn that run at once
+_MAX_PARALLEL_TOOLS = 4
+
+# Prep tools that only read shared state (or add to it under the prep lock), so they can run concurrently
+_PARALLEL_TOOLS = frozenset({"analyze", "search", "fetch_source", "read_prep"})
+
+# Prep messages (the last two assistant/tool-result pairs) whose tool results are resent in full
+_VERBATIM_TOOL_MESSAGES = 4
+
+# Prompt size (three quarters of the 200k context window) past which prep resends only the newest tool results in full
+_PREP_COMPACT_PROMPT_TOKENS = 150_000
+
+# Schema for a single card cut, shared by cut_card and cut_cards
+_CUT_CARD_PROPERTIES = {
+    "fetch_id": {
+        "type": "string",
+        "description": "The fetch_id from fetch_source",
+    },
+    "start_phrase": {
+        "type": "string",
+        "description": "Exact phrase where the card should START (3-10 words). Tool will find this and start cutting from here.",
+    },
+    "end_phrase": {
+        "type": "string",
+        "description": "Exact phrase where the card should END (3-10 words). Tool will find this and stop cutting here. Should be AFTER start_phrase in the text.",
+    },
+    "tag": {
+        "type": "string",
+        "description": "Brief label (5-10 words) stating what the card PROVES",
+    },
+    "argument": {
+        "type": "string",
+        "description": "The SPECIFIC claim this card relates to (NOT a vague topic)",
+    },
+    "purpose": {
+        "type": "string",
+        "enum": ["support", "answer", "extension", "impact"],
+        "description": "Strategic purpose of this card",
+    },
+    "author": {
+        "type": "string",
+        "description": "Author's full name",
+    },
+    "credentials": {
+        "type": "string",
+        "description": "Author's qualifications (e.g., 'Professor of Economics at MIT')",
+    },
+    "year": {
+        "type": "string",
+        "description": "Publication year",
+    },
+    "source": {
+        "type": "string",
+        "description": "Publication name (e.g., 'New York Times')",
+    },
+    "evidence_type": {
+        "type": "string",
+        "enum": ["statistical", "analytical", "consensus", "empirical", "predictive"],
+        "description": "Type of evidence",
+    },
+}
+_CUT_CARD_REQUIRED = [
+    "fetch_id",
+    "start_phrase",
+    "end_phrase",
+    "tag",
+    "argument",
+    "purpose",
+    "author",
+    "credentials",
+    "year",
+    "source",
+]
+
+# Tools offered to the prep agent; built once so every prep run sends identical schema bytes
+_PREP_TOOLS: list[dict] = [
+    {
+        "name": "analyze",
+        "description": "Run systematic analysis processes to produce structured outputs that inform research and strategy.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "analysis_type": {
+                    "type": "string",
+                    "enum": [
+                        # Exploration
+                        "enumerate_arguments",
+                        "adversarial_brainstorm",
+                        "find_novel_angles",
+                        "identify_uncertainty",
+                        # Exploitation
+                        "brainstorm_rebuttals",
+                        "analyze_source",
+                        "extend_argument",
+                        "build_block",
+                        "synthesize_evidence",
+                        # Strategic
+                        "map_clash",
+                        "identify_framework",
+                    ],
+                    "description": "Type of systematic analysis to perform",
+                },
+                "subject": {
+                    "type": "string",
+                    "description": "Subject of analysis (e.g., card ID, opponent claim). Optional for some types.",
+                },
+            },
+            "required": ["analysis_type"],
+        },
+    },
+    {
+        "name": "search",
+        "description": "Search for sources on a topic. Returns search results with descriptions. Use fetch_source to get full article text.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query to find sources",
+                },
+                "num_results": {
+                    "type": "integer",
+                    "default": 5,
+                    "description": "Number of search results to return (default 5)",
+                },
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "fetch_source",
+        "description": "Fetch full article text from a URL. Returns a fetch_id that you can reference when cutting cards. The text is stored so you don't need to copy it.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL of the article to fetch",
+                },
+            },
+            "required": ["url"],
+        },
+    },
+    {
+        "name": "cut_card",
+        "description": "Cut a card from a fetched source. Like editing code - specify WHERE to cut (start/end phrases), and the tool extracts that section programmatically. No need to copy the text yourself. You can cut multiple cards from the same fetch_id.",
+        "input_schema": {
+            "type": "object",
+            "properties": _CUT_CARD_PROPERTIES,
+            "required": _CUT_CARD_REQUIRED,
+        },
+    },
+    {
+        "name": "cut_cards",
+        "description": "Cut several cards in one call (e.g., multiple cards from the same fetch_id). Each item takes the same fields as cut_card. Saves the debate file once for the whole batch.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "cuts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": _CUT_CARD_PROPERTIES,
+                        "required": _CUT_CARD_REQUIRED,
+                    },
+                    "description": "Cards to cut, each with the same fields as cut_card",
+                },
+            },
+            "required": ["cuts"],
+        },
+    },
+    {
+        "name": "read_prep",
+        "description": "View current prep state to see what you've built and identify gaps. Use to avoid redundant research.",
+        "input_schema": {"type": "object", "properties": {}},
+    },
+]
+
+
+@functools.lru_cache(maxsize=32)
 def load_prompt_template(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (read once per process)."""
     prompts_dir = Path(__file__).parent / "prompts"
     template_path = prompts_dir / f"{name}.md"
     return template_path.read_text()
 
 
+def _url_cache_path(url: str) -> Path:
+    """Return the URL cache file for url."""
+    return _URL_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.txt"
+
+
+def _read_cached_url(url: str) -> str | None:
+    """Return previously extracted text for url, or None if it was never cached, has expired or is unreadable."""
+    path = _url_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime > _URL_CACHE_TTL_SECONDS:
+            return None
+        with open(path, encoding="utf-8", newline="") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_cached_url(url: str, text: str) -> None:
+    """Save extracted text for url so later fetches skip the download."""
+    _URL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _write_text_atomic(_url_cache_path(url), text, newline="")
+
+
+def _prune_url_cache() -> None:
+    """Delete expired URL cache entries, then the oldest ones until the cache fits in _URL_CACHE_MAX_BYTES."""
+    entries = []
+    try:
+        with os.scandir(_URL_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except FileNotFoundError:
+        return
+
+    cutoff = time.time() - _URL_CACHE_TTL_SECONDS
+    total = sum(size for _, size, _ in entries)
+    for mtime, size, path in sorted(entries):
+        if mtime >= cutoff and total <= _URL_CACHE_MAX_BYTES:
+            break
+        Path(path).unlink(missing_ok=True)
+        total -= size
+
+
+def _summarize_tool_result(tool_name: str, result: dict) -> str:
+    """Summarize a prep tool result in one line, keeping short scalar fields and list sizes."""
+    parts = []
+    for key, value in result.items():
+        if isinstance(value, list):
+            parts.append(f"{key}: {len(value)} items")
+        elif isinstance(value, str | int | float | bool) and len(str(value)) <= 80:
+            parts.append(f"{key}={value}")
+    return f"[{tool_name} result summarized to save context; call read_prep for current state] " + ", ".join(parts)
+
+
+def _prompt_tokens(usage: "Usage") -> int:
+    """Total prompt tokens for a response, including any read from or written to the prompt cache."""
+    return usage.input_tokens + (usage.cache_read_input_tokens or 0) + (usage.cache_creation_input_tokens or 0)
+
+
+def _compact_tool_results(messages: list[dict], summaries: dict[str, str]) -> None:
+    """Replace full tool_result contents in messages with their summaries, in place.
+
+    Only the content of each tool_result is replaced, so every tool_use keeps
+    its matching tool_result.
+    """
+    for message in messages:
+        if message["role"] != "user" or not isinstance(message["content"], list):
+            continue
+        for block in message["content"]:
+            summary = summaries.get(block.get("tool_use_id", ""))
+            if summary is not None:
+                block["content"] = summary
+
+
 class DebateAgent:
     """A debate agent capable of research, case generation, and delivering speeches.
 
@@ -51,8 +357,20 @@ class DebateAgent:
         """
         self.side = side
         self.resolution = resolution
-        self.client = anthropic.Anthropic()
+        self.client = get_client()
         self.prep_file: PrepFile | None = None
+        self._flat_writer: FlatDebateFileWriter | None = None
+        self._flat_file: FlatDebateFile | None = None
+        # Fetched-source metadata by fetch_id (text lives on disk under FETCH_CACHE_DIR)
+        self.fetched_sources: dict[str, dict] = {}
+        # Exact-match crossfire responses keyed by request hash, oldest first
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        # Generated cases keyed by a hash of resolution, side and evidence used
+        self._case_cache: dict[str, Case] = {}
+        # Summaries of the middle of long rounds, keyed by a hash of the speeches they cover
+        self._speech_summaries: dict[str, str] = {}
+        # Guards prep_file, the cached flat file and fetched_sources while prep tools run in parallel
+        self._prep_lock = threading.RLock()
 
     def research(
         self,
@@ -72,9 +390,7 @@ class DebateAgent:
         Returns:
             DebateFile with researched evidence
         """
-        from debate.research_agent import research_evidence
-
-        return research_evidence(
+        return _research_evidence(
             resolution=self.resolution,
             side=self.side,
             topic=topic,
@@ -99,12 +415,10 @@ class DebateAgent:
         evidence_buckets = None
         if debate_file:
             # Convert debate file sections to evidence buckets for compatibility
-            from debate.models import EvidenceBucket
-
             sections = debate_file.get_sections_for_side(self.side)
             evidence_buckets = []
             for section in sections:
-                cards = [debate_file.get_card(card_id) for card_id in section.card_ids]
+                cards = debate_file.get_cards(section.card_ids)
                 bucket = EvidenceBucket(
                     topic=section.argument,
                     resolution=self.resolution,
@@ -113,12 +427,30 @@ class DebateAgent:
                 )
                 evidence_buckets.append(bucket)
 
-        return _generate_case(
+        # Same resolution, side and evidence (bucket topics and card ids) -> reuse the case generated earlier
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.resolution, self.side.value):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        for bucket in evidence_buckets or []:
+            digest.update(bucket.topic.encode())
+            digest.update(b"\1")
+            for card in bucket.cards:
+                digest.update(card.id.encode())
+                digest.update(b"\0")
+        cache_key = digest.hexdigest()
+        cached = self._case_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        case = _generate_case(
             resolution=self.resolution,
             side=self.side,
             evidence_buckets=evidence_buckets,
             stream=stream,
         )
+        self._case_cache[cache_key] = case.model_copy(deep=True)
+        return case
 
     def generate_speech(
         self,
@@ -140,43 +472,39 @@ class DebateAgent:
         Returns:
             The full text of the speech
         """
-        template = load_prompt_template("speech_generation")
+        # Format round context, writing fragments (including whole speeches) straight into one buffer
+        context = io.StringIO()
 
-        # Format round context
-        context_lines = []
+        our_case, opponent_case, our_team, opponent_team = self._roles(round_state)
 
         # Add our case
-        if self.side == round_state.team_a_side:
-            our_case = round_state.team_a_case
-            opponent_case = round_state.team_b_case
-            our_team = "Team A"
-            opponent_team = "Team B"
-        else:
-            our_case = round_state.team_b_case
-            opponent_case = round_state.team_a_case
-            our_team = "Team B"
-            opponent_team = "Team A"
-
         if our_case:
-            context_lines.append(f"## Our Case ({our_team} - {self.side.value.upper()})\n")
-            context_lines.append(our_case.format())
-            context_lines.append("")
+            context.write(f"## Our Case ({our_team} - {self.side.value.upper()})\n\n")
+            context.write(our_case.format())
+            context.write("\n\n")
 
         if opponent_case:
-            context_lines.append(f"## Opponent's Case ({opponent_team} - {self.side.opposite.value.upper()})\n")
-            context_lines.append(opponent_case.format())
-            context_lines.append("")
-
-        # Add previous speeches
-        if round_state.speeches:
-            context_lines.append("## Previous Speeches\n")
-            for i, speech in enumerate(round_state.speeches, 1):
-                speaker = our_team if speech.side == self.side else opponent_team
-                context_lines.append(f"### Speech {i}: {speaker} {speech.speech_type.value.title()}\n")
-                context_lines.append(speech.content)
-                context_lines.append("")
-
-        round_context = "\n".join(context_lines)
+            context.write(f"## Opponent's Case ({opponent_team} - {self.side.opposite.value.upper()})\n\n")
+            context.write(opponent_case.format())
+            context.write("\n\n")
+
+        # Add previous speeches (the middle of an over-long round is summarized)
+        speeches = round_state.speeches
+        if speeches:
+            summary = self._summarize_middle_speeches(speeches, our_team, opponent_team)
+            context.write("## Previous Speeches\n\n")
+            for i, speech in enumerate(speeches, 1):
+                if summary is not None and 1 < i < len(speeches):
+                    if i == 2:
+                        context.write(f"### Speeches 2-{len(speeches) - 1}: Summary\n\n")
+                        context.write(summary)
+                        context.write("\n\n")
+                    continue
+                context.write(self._speech_heading(i, speech, our_team, opponent_team))
+                context.write(speech.content)
+                context.write("\n\n")
+
+        round_context = context.getvalue()
 
         # Format available evidence
         evidence_section = ""
@@ -187,57 +515,180 @@ class DebateAgent:
         words_per_minute = 150
         word_limit = int((time_limit_seconds / 60) * words_per_minute)
 
-        prompt = template.format(
+        # Static instructions go in the (cached) system prompt; per-speech details in the user message
+        system_prompt = load_prompt_template("speech_generation").format(
             resolution=self.resolution,
             side=self.side.value.upper(),
+        )
+        prompt = load_prompt_template("speech_generation_request").format(
             goal=goal,
             round_context=round_context,
-            available_evidence=evidence_section,
             time_limit_seconds=time_limit_seconds,
             word_limit=word_limit,
         )
 
+        # Evidence only grows during a round, so it follows the instructions as its own cached block
+        return self._respond(system_prompt, prompt, max_tokens=4096, stream=stream, extra_system=evidence_section)
+
+    def _speech_heading(self, number: int, speech: Speech, our_team: str, opponent_team: str) -> str:
+        """Heading for one prior speech in the round context."""
+        speaker = our_team if speech.side == self.side else opponent_team
+        return f"### Speech {number}: {speaker} {speech.speech_type.value.title()}\n\n"
+
+    def _summarize_middle_speeches(self, speeches: list[Speech], our_team: str, opponent_team: str) -> str | None:
+        """Summarize all but the first and last speech once the round outgrows its context budget.
+
+        Returns None while every speech still fits (the usual case). Summaries
+        are cached by the exact speeches they cover, so later calls over the same
+        speeches don't summarize again.
+        """
+        total_chars = sum(len(speech.content) for speech in speeches)
+        if len(speeches) < 3 or total_chars <= _SPEECH_CONTEXT_TOKEN_BUDGET * _CHARS_PER_TOKEN:
+            return None
+
+        transcript = io.StringIO()
+        for i, speech in enumerate(speeches[1:-1], 2):
+            transcript.write(self._speech_heading(i, speech, our_team, opponent_team))
+            transcript.write(speech.content)
+            transcript.write("\n\n")
+        middle = transcript.getvalue()
+
+        cache_key = hashlib.blake2b(middle.encode(), digest_size=16).hexdigest()
+        summary = self._speech_summaries.get(cache_key)
+        if summary is None:
+            message = self.client.messages.create(
+                model=Config().get_agent_model("speech_summarizer"),
+                max_tokens=1024,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": "Summarize these Public Forum debate speeches for a debater preparing the next "
+                        "speech. For each speech, list in brief bullets every argument, response, extension and "
+                        "concession, with the evidence cited (author and year). Note which arguments have gone "
+                        f"unanswered.\n\n{middle}",
+                    }
+                ],
+            )
+            first_block = message.content[0]
+            summary = first_block.text if hasattr(first_block, "text") else ""
+            self._speech_summaries[cache_key] = summary
+        return summary
+
+    def _respond(
+        self,
+        system_prompt: str,
+        prompt: str,
+        max_tokens: int,
+        stream: bool,
+        extra_system: str = "",
+        cache: bool = False,
+    ) -> str:
+        """Get a text response, sending the system prompt as prompt-cached blocks.
+
+        The system prompt holds content that repeats across calls (instructions,
+        resolution, cases, evidence), so marking it cacheable lets later calls
+        reuse the prefix instead of paying for it again. extra_system, if given,
+        becomes a second cached block after system_prompt.
+
+        With cache=True, an identical request (same prompts and max_tokens) made
+        earlier by this agent is answered from memory without an API call.
+        """
+        cache_key = ""
+        if cache:
+            digest = hashlib.blake2b(digest_size=16)
+            for part in (str(max_tokens), system_prompt, extra_system, prompt):
+                digest.update(part.encode())
+                digest.update(b"\0")
+            cache_key = digest.hexdigest()
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                if stream:
+                    print(cached)
+                return cached
+
+        system = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        if extra_system:
+            system.append({"type": "text", "text": extra_system, "cache_control": {"type": "ephemeral"}})
+
         if stream:
-            response_text = ""
             with self.client.messages.stream(
                 model="claude-sonnet-4-20250514",
-                max_tokens=4096,
+                max_tokens=max_tokens,
+                system=system,
                 messages=[{"role": "user", "content": prompt}],
             ) as stream_response:
-                for text in stream_response.text_stream:
-                    print(text, end="", flush=True)
-                    response_text += text
+                response_text = print_stream(stream_response.text_stream)
             print()
         else:
             message = self.client.messages.create(
                 model="claude-sonnet-4-20250514",
-                max_tokens=4096,
+                max_tokens=max_tokens,
+                system=system,
                 messages=[{"role": "user", "content": prompt}],
             )
             first_block = message.content[0]
             response_text = first_block.text if hasattr(first_block, "text") else ""
 
+        if cache_key:
+            self._response_cache[cache_key] = response_text
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
         return response_text
 
+    def clear_cache(self) -> None:
+        """Forget cached responses and cases so repeated requests hit the API again."""
+        self._response_cache.clear()
+        self._case_cache.clear()
+
     def _format_available_evidence(self, debate_file: DebateFile) -> str:
-        """Format available evidence for inclusion in speech prompts."""
-        lines = ["## Available Evidence\n"]
+        """Format available evidence for inclusion in speech prompts.
 
+        Sections and cards are listed in their stored (append) order, so evidence
+        added mid-round lands at the end and the existing listing stays a stable,
+        cacheable prefix.
+        """
         sections = debate_file.get_sections_for_side(self.side)
-        if not sections:
+        if not any(section.card_ids for section in sections):
             return ""
 
+        out = io.StringIO()
+        out.write("## Available Evidence\n\n")
+        listed_any = False
         for section in sections:
-            lines.append(f"### {section.get_heading()}\n")
-            for card_id in section.card_ids:
-                card = debate_file.get_card(card_id)
-                if card:
-                    last_name = card.author.split()[-1]
-                    lines.append(f"- **{card.tag}** ({last_name} {card.year}) `[{card_id}]`")
-                    lines.append(f"  - {card.text[:200]}...")
-                    lines.append("")
+            cards = [
+                (card_id, card)
+                for card_id, card in zip(section.card_ids, debate_file.get_cards(section.card_ids), strict=True)
+                if card
+            ]
+            if not cards:
+                continue
+            listed_any = True
+            out.write(f"### {section.get_heading()}\n\n")
+            for card_id, card in cards:
+                out.write(f"- **{card.tag}** ({card.last_name} {card.year}) `[{card_id}]`\n")
+                out.write(f"  - {card.text[:200]}...\n\n")
+
+        # With no cards to list, send no evidence block at all rather than empty headings
+        return out.getvalue() if listed_any else ""
+
+    def _roles(self, round_state: RoundState) -> tuple[Case | None, Case | None, str, str]:
+        """Return (our case, opponent's case, our team label, opponent's team label) for this round."""
+        if self.side == round_state.team_a_side:
+            return round_state.team_a_case, round_state.team_b_case, "Team A", "Team B"
+        return round_state.team_b_case, round_state.team_a_case, "Team B", "Team A"
 
-        return "\n".join(lines)
+    def _crossfire_context(self, round_state: RoundState) -> str:
+        """Build the crossfire system prompt: who we are and both cases."""
+        our_case, opponent_case, _, _ = self._roles(round_state)
+        return f"""You are debating {self.side.value.upper()} on: {self.resolution}
+
+Your case:
+{our_case.format() if our_case else "(No case yet)"}
+
+Opponent's case:
+{opponent_case.format() if opponent_case else "(No case yet)"}"""
 
     def answer_crossfire_question(
         self,
@@ -255,43 +706,14 @@ class DebateAgent:
         Returns:
             The answer to the question
         """
-        # Format context about the round
-        our_case = round_state.team_a_case if self.side == round_state.team_a_side else round_state.team_b_case
-        opponent_case = round_state.team_b_case if self.side == round_state.team_a_side else round_state.team_a_case
-
-        context = f"""You are debating {self.side.value.upper()} on: {self.resolution}
-
-Your case:
-{our_case.format() if our_case else "(No case yet)"}
-
-Opponent's case:
-{opponent_case.format() if opponent_case else "(No case yet)"}
+        # The cases stay the same for every question in a round, so they go in the cached system prompt
+        context = self._crossfire_context(round_state)
 
-Question from opponent: {question}
+        prompt = f"""Question from opponent: {question}
 
 Provide a concise, strategic answer (1-3 sentences). Be confident but don't concede key points."""
 
-        if stream:
-            response_text = ""
-            with self.client.messages.stream(
-                model="claude-sonnet-4-20250514",
-                max_tokens=512,
-                messages=[{"role": "user", "content": context}],
-            ) as stream_response:
-                for text in stream_response.text_stream:
-                    print(text, end="", flush=True)
-                    response_text += text
-            print()
-        else:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=512,
-                messages=[{"role": "user", "content": context}],
-            )
-            first_block = message.content[0]
-            response_text = first_block.text if hasattr(first_block, "text") else ""
-
-        return response_text
+        return self._respond(context, prompt, max_tokens=512, stream=stream, cache=True)
 
     def ask_crossfire_question(
         self,
@@ -307,43 +729,15 @@ Provide a concise, strategic answer (1-3 sentences). Be confident but don't conc
         Returns:
             A strategic question to ask the opponent
         """
-        our_case = round_state.team_a_case if self.side == round_state.team_a_side else round_state.team_b_case
-        opponent_case = round_state.team_b_case if self.side == round_state.team_a_side else round_state.team_a_case
+        # The cases stay the same for every question in a round, so they go in the cached system prompt
+        context = self._crossfire_context(round_state)
 
-        context = f"""You are debating {self.side.value.upper()} on: {self.resolution}
-
-Your case:
-{our_case.format() if our_case else "(No case yet)"}
-
-Opponent's case:
-{opponent_case.format() if opponent_case else "(No case yet)"}
-
-Generate a strategic crossfire question (1-2 sentences) that:
+        prompt = """Generate a strategic crossfire question (1-2 sentences) that:
 - Exposes a weakness in their case
 - Sets up a future argument
 - Forces them to concede something helpful to your side"""
 
-        if stream:
-            response_text = ""
-            with self.client.messages.stream(
-                model="claude-sonnet-4-20250514",
-                max_tokens=256,
-                messages=[{"role": "user", "content": context}],
-            ) as stream_response:
-                for text in stream_response.text_stream:
-                    print(text, end="", flush=True)
-                    response_text += text
-            print()
-        else:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=256,
-                messages=[{"role": "user", "content": context}],
-            )
-            first_block = message.content[0]
-            response_text = first_block.text if hasattr(first_block, "text") else ""
-
-        return response_text
+        return self._respond(context, prompt, max_tokens=256, stream=stream)
 
     # ========== Autonomous Prep Methods ==========
 
@@ -370,150 +764,14 @@ Generate a strategic crossfire question (1-2 sentences) that:
         self.prep_file = PrepFile(resolution=self.resolution, side=self.side)
 
         # Storage for fetched sources (so agent can reference them without copying text)
-        self.fetched_sources: dict[str, dict] = {}
+        self.fetched_sources = {}
+        _prune_url_cache()
 
-        # Define tools for agent
-        tools = [
-            {
-                "name": "analyze",
-                "description": "Run systematic analysis processes to produce structured outputs that inform research and strategy.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "analysis_type": {
-                            "type": "string",
-                            "enum": [
-                                # Exploration
-                                "enumerate_arguments",
-                                "adversarial_brainstorm",
-                                "find_novel_angles",
-                                "identify_uncertainty",
-                                # Exploitation
-                                "brainstorm_rebuttals",
-                                "analyze_source",
-                                "extend_argument",
-                                "build_block",
-                                "synthesize_evidence",
-                                # Strategic
-                                "map_clash",
-                                "identify_framework",
-                            ],
-                            "description": "Type of systematic analysis to perform",
-                        },
-                        "subject": {
-                            "type": "string",
-                            "description": "Subject of analysis (e.g., card ID, opponent claim). Optional for some types.",
-                        },
-                    },
-                    "required": ["analysis_type"],
-                },
-            },
-            {
-                "name": "search",
-                "description": "Search for sources on a topic. Returns search results with descriptions. Use fetch_source to get full article text.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query to find sources",
-                        },
-                        "num_results": {
-                            "type": "integer",
-                            "default": 5,
-                            "description": "Number of search results to return (default 5)",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            },
-            {
-                "name": "fetch_source",
-                "description": "Fetch full article text from a URL. Returns a fetch_id that you can reference when cutting cards. The text is stored so you don't need to copy it.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL of the article to fetch",
-                        },
-                    },
-                    "required": ["url"],
-                },
-            },
-            {
-                "name": "cut_card",
-                "description": "Cut a card from a fetched source. Like editing code - specify WHERE to cut (start/end phrases), and the tool extracts that section programmatically. No need to copy the text yourself. You can cut multiple cards from the same fetch_id.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "fetch_id": {
-                            "type": "string",
-                            "description": "The fetch_id from fetch_source",
-                        },
-                        "start_phrase": {
-                            "type": "string",
-                            "description": "Exact phrase where the card should START (3-10 words). Tool will find this and start cutting from here.",
-                        },
-                        "end_phrase": {
-                            "type": "string",
-                            "description": "Exact phrase where the card should END (3-10 words). Tool will find this and stop cutting here. Should be AFTER start_phrase in the text.",
-                        },
-                        "tag": {
-                            "type": "string",
-                            "description": "Brief label (5-10 words) stating what the card PROVES",
-                        },
-                        "argument": {
-                            "type": "string",
-                            "description": "The SPECIFIC claim this card relates to (NOT a vague topic)",
-                        },
-                        "purpose": {
-                            "type": "string",
-                            "enum": ["support", "answer", "extension", "impact"],
-                            "description": "Strategic purpose of this card",
-                        },
-                        "author": {
-                            "type": "string",
-                            "description": "Author's full name",
-                        },
-                        "credentials": {
-                            "type": "string",
-                            "description": "Author's qualifications (e.g., 'Professor of Economics at MIT')",
-                        },
-                        "year": {
-                            "type": "string",
-                            "description": "Publication year",
-                        },
-                        "source": {
-                            "type": "string",
-                            "description": "Publication name (e.g., 'New York Times')",
-                        },
-                        "evidence_type": {
-                            "type": "string",
-                            "enum": ["statistical", "analytical", "consensus", "empirical", "predictive"],
-                            "description": "Type of evidence",
-                        },
-                    },
-                    "required": [
-                        "fetch_id",
-                        "start_phrase",
-                        "end_phrase",
-                        "tag",
-                        "argument",
-                        "purpose",
-                        "author",
-                        "credentials",
-                        "year",
-                        "source",
-                    ],
-                },
-            },
-            {
-                "name": "read_prep",
-                "description": "View current prep state to see what you've built and identify gaps. Use to avoid redundant research.",
-                "input_schema": {"type": "object", "properties": {}},
-            },
-        ]
+        # Reread the flat debate file: another prep run or the CLI may have added cards since it was cached
+        self._invalidate_flat_file()
+
+        # Persist cut cards in the background while the agent keeps working
+        self._flat_writer = FlatDebateFileWriter()
 
         # Load system prompt
         template = load_prompt_template("prep_orchestration")
@@ -526,6 +784,10 @@ Generate a strategic crossfire question (1-2 sentences) that:
         )
 
         messages = []
+        # One-line summary of each tool result, by tool_use_id, used once the full result ages out
+        tool_summaries: dict[str, str] = {}
+        # The tool_result block currently carrying the transcript's cache breakpoint (the newest summarized one)
+        history_breakpoint: dict | None = None
         current_turn = 0
 
         # Initialize log file if path provided
@@ -552,116 +814,147 @@ Generate a strategic crossfire question (1-2 sentences) that:
         print(f"Budget: {max_turns} turns")
         print(f"{'=' * 60}\n")
 
-        while current_turn < max_turns:
-            current_turn += 1
-            print(f"\n--- Turn {current_turn}/{max_turns} ---\n")
-
-            if log_file:
-                log_file.write(f"\n{'─' * 60}\n")
-                log_file.write(f"Turn {current_turn}/{max_turns}\n")
-                log_file.write(f"{'─' * 60}\n\n")
-                log_file.flush()
-
-            # Add turn tracking to the first message
-            if not messages:
-                initial_msg = f"Begin prep. Current turn: {current_turn}/{max_turns}"
-                messages.append({"role": "user", "content": initial_msg})
-
-            # Call Claude with tools
-            response = self.client.messages.create(
-                model="claude-sonnet-4-5",
-                max_tokens=4096,
-                system=system_prompt,
-                messages=messages,
-                tools=tools,
-            )
-
-            # Add assistant response to messages (content must be list of blocks for tool use)
-            messages.append({"role": "assistant", "content": list(response.content)})  # type: ignore[dict-item]
-
-            # Display thinking
-            for block in response.content:
-                if block.type == "text":
-                    print(block.text)
-                    print()
-                    if log_file:
-                        log_file.write(f"\nAgent Thinking:\n{block.text}\n")
-                        log_file.flush()
-
-            # Handle tool use
-            if response.stop_reason == "tool_use":
-                tool_results = []
+        try:
+            while current_turn < max_turns:
+                current_turn += 1
+                print(f"\n--- Turn {current_turn}/{max_turns} ---\n")
 
+                if log_file:
+                    log_file.write(f"\n{'─' * 60}\n")
+                    log_file.write(f"Turn {current_turn}/{max_turns}\n")
+                    log_file.write(f"{'─' * 60}\n\n")
+                    log_file.flush()
+
+                # Add turn tracking to the first message
+                if not messages:
+                    initial_msg = f"Begin prep. Current turn: {current_turn}/{max_turns}"
+                    messages.append({"role": "user", "content": initial_msg})
+
+                # Call Claude with tools
+                # Tools and system prompt are identical every turn; the cache breakpoint on the
+                # system block covers both (tools come first in the prompt)
+                system = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+                response: Message
+                if stream:
+                    # Show the agent's thinking as it arrives instead of after the whole turn
+                    with self.client.messages.stream(
+                        model="claude-sonnet-4-5",
+                        max_tokens=4096,
+                        system=system,
+                        messages=messages,
+                        tools=_PREP_TOOLS,
+                    ) as stream_response:
+                        if print_stream(stream_response.text_stream):
+                            print("\n")
+                        response = stream_response.get_final_message()
+                else:
+                    response = self.client.messages.create(
+                        model="claude-sonnet-4-5",
+                        max_tokens=4096,
+                        system=system,
+                        messages=messages,
+                        tools=_PREP_TOOLS,
+                    )
+
+                prompt_tokens = _prompt_tokens(response.usage)
+
+                # Add assistant response to messages (content must be list of blocks for tool use)
+                messages.append({"role": "assistant", "content": list(response.content)})  # type: ignore[dict-item]
+
+                # Display thinking (already shown if streamed)
                 for block in response.content:
-                    if block.type == "tool_use":
-                        tool_name = block.name
-                        tool_input = block.input
+                    if block.type == "text":
+                        if not stream:
+                            print(block.text)
+                            print()
+                        if log_file:
+                            log_file.write(f"\nAgent Thinking:\n{block.text}\n")
+                            log_file.flush()
 
-                        print(f"[Calling {tool_name}...]")
+                # Handle tool use
+                if response.stop_reason == "tool_use":
+                    tool_blocks = [block for block in response.content if block.type == "tool_use"]
+
+                    for block in tool_blocks:
+                        print(f"[Calling {block.name}...]")
 
                         if log_file:
-                            log_file.write(f"\nTool Call: {tool_name}\n")
-                            log_file.write(f"Input: {json.dumps(tool_input, indent=2)}\n")
+                            log_file.write(f"\nTool Call: {block.name}\n")
+                            log_file.write(f"Input: {json.dumps(block.input, indent=2)}\n")
                             log_file.write("─" * 40 + "\n")
                             log_file.flush()
 
-                        # Execute tool
-                        if tool_name == "analyze":
-                            result = self._analyze_skill(
-                                analysis_type=tool_input["analysis_type"],
-                                subject=tool_input.get("subject"),
-                            )
-                        elif tool_name == "search":
-                            result = self._search_skill(
-                                query=tool_input["query"],
-                                num_results=tool_input.get("num_results", 5),
-                            )
-                        elif tool_name == "fetch_source":
-                            result = self._fetch_source_skill(
-                                url=tool_input["url"],
-                            )
-                        elif tool_name == "cut_card":
-                            result = self._cut_card_skill(
-                                fetch_id=tool_input["fetch_id"],
-                                start_phrase=tool_input["start_phrase"],
-                                end_phrase=tool_input["end_phrase"],
-                                tag=tool_input["tag"],
-                                argument=tool_input["argument"],
-                                purpose=tool_input["purpose"],
-                                author=tool_input["author"],
-                                credentials=tool_input["credentials"],
-                                year=tool_input["year"],
-                                source=tool_input["source"],
-                                evidence_type=tool_input.get("evidence_type"),
-                            )
-                        elif tool_name == "read_prep":
-                            result = self._read_prep_skill()
-                        else:
-                            result = {"error": f"Unknown tool: {tool_name}"}
-
+                    # Network-bound tools in one turn run concurrently; tools that change prep state
+                    # run one at a time on this thread, in the order the model asked for them
+                    results: dict[str, dict] = {}
+                    with ThreadPoolExecutor(max_workers=min(len(tool_blocks), _MAX_PARALLEL_TOOLS)) as executor:
+                        futures = {
+                            executor.submit(self._dispatch_tool, block.name, block.input): block
+                            for block in tool_blocks
+                            if block.name in _PARALLEL_TOOLS
+                        }
+                        for block in tool_blocks:
+                            if block.name not in _PARALLEL_TOOLS:
+                                results[block.id] = self._dispatch_tool(block.name, block.input)
+                                print(f"[{block.name} complete]")
+                        for future in as_completed(futures):
+                            print(f"[{futures[future].name} complete]")
+                        print()
+                    for future, block in futures.items():
+                        results[block.id] = future.result()
+
+                    # Results go back in the order the model asked for them
+                    tool_results: list[dict] = []
+                    for block in tool_blocks:
+                        result = results[block.id]
+                        if block.name == "analyze":
+                            print(f"  Analysis ({result['analysis_type']}):\n{result['output']}\n")
+                        tool_summaries[block.id] = _summarize_tool_result(block.name, result)
                         tool_results.append(
                             {
                                 "type": "tool_result",
                                 "tool_use_id": block.id,
-                                "content": json.dumps(result, indent=2),
+                                # Compact JSON: indentation would be billed as input tokens on every later turn
+                                "content": json.dumps(result, separators=(",", ":"), ensure_ascii=False),
                             }
                         )
 
                         if log_file:
-                            log_file.write(f"Result:\n{json.dumps(result, indent=2)}\n\n")
+                            log_file.write(f"Result ({block.name}):\n{json.dumps(result, indent=2)}\n\n")
                             log_file.flush()
 
-                        print(f"[{tool_name} complete]\n")
-
-                # Add tool results to messages (must be list of tool result blocks)
-                messages.append({"role": "user", "content": tool_results})  # type: ignore[dict-item]
+                    # Add tool results to messages (must be list of tool result blocks)
+                    messages.append({"role": "user", "content": tool_results})  # type: ignore[dict-item]
+
+                    # Older results are resent every turn; keep only one-line summaries of them.
+                    # Near the context window, summarize everything but this turn's results so later turns still fit
+                    verbatim = 1 if prompt_tokens > _PREP_COMPACT_PROMPT_TOKENS else _VERBATIM_TOOL_MESSAGES
+                    _compact_tool_results(messages[1:-verbatim], tool_summaries)
+
+                    # Cache the transcript up to the newest summarized result: nothing before it changes again,
+                    # while results still sent in full are rewritten when a later turn summarizes them
+                    compacted: list[dict] = [
+                        m for m in messages[1:-verbatim] if m["role"] == "user" and isinstance(m["content"], list)
+                    ]
+                    if compacted:
+                        if history_breakpoint is not None:
+                            del history_breakpoint["cache_control"]
+                        history_breakpoint = compacted[-1]["content"][-1]
+                        history_breakpoint["cache_control"] = {"type": "ephemeral"}
+
+                elif response.stop_reason == "end_turn":
+                    # Agent decided to stop
+                    print("\n[Agent concluded prep]\n")
+                    if log_file:
+                        log_file.write("\n[Agent concluded prep]\n")
+                    break
 
-            elif response.stop_reason == "end_turn":
-                # Agent decided to stop
-                print("\n[Agent concluded prep]\n")
-                if log_file:
-                    log_file.write("\n[Agent concluded prep]\n")
-                break
+        finally:
+            # Make sure every cut card is on disk, even if a tool, the API or Ctrl-C ended prep early,
+            # and don't leave this session's fetched text behind
+            self._flat_writer.close()
+            self._flat_writer = None
+            self._discard_fetched_sources()
 
         print(f"\n{'=' * 60}")
         print("PREP COMPLETE")
@@ -685,12 +978,50 @@ Generate a strategic crossfire question (1-2 sentences) that:
 
         return self.prep_file
 
-    def _analyze_skill(self, analysis_type: str, subject: str | None = None) -> dict:
+    def _dispatch_tool(self, tool_name: str, tool_input: dict) -> dict:
+        """Run one prep tool call and return its result (safe to call from worker threads)."""
+        if tool_name == "analyze":
+            # Streaming from a worker would interleave with other tools' output; prep prints it afterwards
+            return self._analyze_skill(
+                analysis_type=tool_input["analysis_type"],
+                subject=tool_input.get("subject"),
+                stream=False,
+            )
+        if tool_name == "search":
+            return self._search_skill(
+                query=tool_input["query"],
+                num_results=tool_input.get("num_results", 5),
+            )
+        if tool_name == "fetch_source":
+            return self._fetch_source_skill(
+                url=tool_input["url"],
+            )
+        if tool_name == "cut_card":
+            return self._cut_card_skill(
+                fetch_id=tool_input["fetch_id"],
+                start_phrase=tool_input["start_phrase"],
+                end_phrase=tool_input["end_phrase"],
+                tag=tool_input["tag"],
+                argument=tool_input["argument"],
+                purpose=tool_input["purpose"],
+                author=tool_input["author"],
+                credentials=tool_input["credentials"],
+                year=tool_input["year"],
+                source=tool_input["source"],
+                evidence_type=tool_input.get("evidence_type"),
+            )
+        if tool_name == "cut_cards":
+            return self._cut_cards_skill(cuts=tool_input["cuts"])
+        if tool_name == "read_prep":
+            return self._read_prep_skill()
+        return {"error": f"Unknown tool: {tool_name}"}
+
+    def _analyze_skill(self, analysis_type: str, subject: str | None = None, stream: bool = True) -> dict:
         """Execute an analysis skill."""
         analysis_enum = AnalysisType(analysis_type)
 
         # Route to specific analysis implementation
-        output = self._run_analysis(analysis_type, subject)
+        output = self._run_analysis(analysis_type, subject, stream=stream)
 
         result = AnalysisResult(
             analysis_type=analysis_enum,
@@ -699,8 +1030,9 @@ Generate a strategic crossfire question (1-2 sentences) that:
             timestamp=datetime.now().isoformat(),
         )
 
-        if self.prep_file:
-            self.prep_file.add_analysis(result)
+        with self._prep_lock:
+            if self.prep_file:
+                self.prep_file.add_analysis(result)
 
         return {
             "analysis_type": analysis_type,
@@ -708,8 +1040,8 @@ Generate a strategic crossfire question (1-2 sentences) that:
             "status": "completed",
         }
 
-    def _run_analysis(self, analysis_type: str, subject: str | None = None) -> str:
-        """Run breadcrumb analysis using LLM with streaming output.
+    def _run_analysis(self, analysis_type: str, subject: str | None = None, stream: bool = True) -> str:
+        """Run breadcrumb analysis using LLM, streaming output unless stream is False.
 
         Analysis should be CONCISE bullet points showing:
         - Argument links (X -> Y -> Z)
@@ -760,17 +1092,23 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
 
         prompt = prompts.get(analysis_type, f"Perform {analysis_type} breadcrumb analysis for {self.resolution}")
 
+        if not stream:
+            message = self.client.messages.create(
+                model="claude-sonnet-4-5",
+                max_tokens=256,  # Strict limit for breadcrumb analysis (was 1024)
+                messages=[{"role": "user", "content": prompt}],
+            )
+            first_block = message.content[0]
+            return first_block.text if hasattr(first_block, "text") else ""
+
         # Stream the response for user feedback
         print(f"\n  Analyzing ({analysis_type})...\n")
-        response_text = ""
         with self.client.messages.stream(
             model="claude-sonnet-4-5",
             max_tokens=256,  # Strict limit for breadcrumb analysis (was 1024)
             messages=[{"role": "user", "content": prompt}],
-        ) as stream:
-            for text in stream.text_stream:
-                print(text, end="", flush=True)
-                response_text += text
+        ) as stream_response:
+            response_text = print_stream(stream_response.text_stream)
         print("\n")
 
         return response_text
@@ -779,7 +1117,10 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
         """Execute research skill: backfiles first, then web search, organize immediately."""
         purpose_enum = SectionType(purpose)
 
-        # Step 1: Check backfiles for existing evidence
+        # Step 1: Check backfiles for existing evidence.
+        # This is a local JSON read, so it isn't overlapped with web research: starting the
+        # web request speculatively would save milliseconds but spend searches and model calls
+        # on cards the backfile may already cover, and its writes to the flat file can't be cancelled.
         debate_file = load_debate_file(self.resolution)
         existing_cards = []
         sources_used = []
@@ -794,6 +1135,9 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
 
         if cards_needed > 0:
             print(f"  Researching {cards_needed} more cards from web...")
+            # The research agent rewrites the flat file on disk; drop our in-memory copy
+            with self._prep_lock:
+                self._invalidate_flat_file()
             # Use existing research agent (returns DebateFile)
             updated_debate_file = _research_evidence(
                 resolution=self.resolution,
@@ -806,21 +1150,20 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
             # Extract newly added cards from the debate file
             # The research agent adds cards to sections, so get them from the appropriate side
             sections = updated_debate_file.get_sections_for_side(self.side)
+            topic_lower = topic.lower()
+            seen_ids = {card.id for card in existing_cards}
             for section in sections:
-                if topic.lower() in section.argument.lower():
-                    for card_id in section.card_ids:
-                        card = updated_debate_file.get_card(card_id)
-                        if card and card not in existing_cards:
+                if topic_lower in section.argument.lower():
+                    for card in updated_debate_file.get_cards(section.card_ids):
+                        if card and card.id not in seen_ids:
+                            seen_ids.add(card.id)
                             new_cards.append(card)
 
-            # Extract sources from cards
-            sources_used = list(set(card.source for card in new_cards if hasattr(card, "source")))
+            # Extract sources from cards, in the order they were cut (so sources_used[:3] is stable)
+            sources_used = list(dict.fromkeys(card.source for card in new_cards))
 
         # Step 3: Organize into PrepFile immediately
-        all_card_ids = []
-        for card in existing_cards + new_cards:
-            if hasattr(card, "id"):
-                all_card_ids.append(card.id)
+        all_card_ids = list(dict.fromkeys(card.id for card in itertools.chain(existing_cards, new_cards)))
 
         argument = ArgumentPrep(
             claim=topic,
@@ -830,8 +1173,9 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
             strategic_notes=f"Evidence for {purpose}",
         )
 
-        if self.prep_file:
-            self.prep_file.add_argument(argument)
+        with self._prep_lock:
+            if self.prep_file:
+                self.prep_file.add_argument(argument)
 
         # Log research
         entry = ResearchEntry(
@@ -844,8 +1188,9 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
             timestamp=datetime.now().isoformat(),
         )
 
-        if self.prep_file:
-            self.prep_file.log_research(entry)
+        with self._prep_lock:
+            if self.prep_file:
+                self.prep_file.log_research(entry)
 
         return {
             "topic": topic,
@@ -858,21 +1203,16 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
 
     def _read_prep_skill(self) -> dict:
         """Return current prep state summary."""
-        if self.prep_file:
-            return self.prep_file.get_summary()
+        with self._prep_lock:
+            if self.prep_file:
+                return self.prep_file.get_summary()
         return {"error": "No prep file available"}
 
     def _search_skill(self, query: str, num_results: int = 5) -> dict:
         """Execute web search and return formatted results."""
-        import time
-
-        from debate.research_agent import _brave_search
-
         print(f"  Searching for: {query[:70]}...")
 
-        # Add 3-second pause to avoid rate limiting
-        time.sleep(3)
-
+        # _brave_search spaces calls out itself, so concurrent searches don't trip Brave's rate limit
         search_results = _brave_search(query, num_results=num_results)
 
         if search_results:
@@ -896,34 +1236,31 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
 
         Stores the text internally and returns a fetch_id for reference.
         """
-        import uuid
-
-        import trafilatura
-
         print(f"  Fetching: {url[:60]}...")
 
         try:
-            # Download and extract text
-            downloaded = trafilatura.fetch_url(url)
-            if not downloaded:
-                return {
-                    "status": "error",
-                    "message": f"Failed to download content from {url}",
-                }
-
-            # Extract main text content
-            text = trafilatura.extract(
-                downloaded,
-                include_comments=False,
-                include_tables=False,
-                no_fallback=False,
-            )
-
-            if not text:
-                return {
-                    "status": "error",
-                    "message": f"Could not extract text from {url}",
-                }
+            # The full extracted text is cached by URL (before truncation), so refetching skips the network
+            text = _read_cached_url(url)
+            if text is not None:
+                print("  ✓ Using cached copy")
+            else:
+                # Download and extract text
+                downloaded = trafilatura.fetch_url(url)
+                if not downloaded:
+                    return {
+                        "status": "error",
+                        "message": f"Failed to download content from {url}",
+                    }
+
+                # Extract main text content (fast path first, trafilatura fallback)
+                text = extract_article_text(downloaded, include_tables=False)
+
+                if not text:
+                    return {
+                        "status": "error",
+                        "message": f"Could not extract text from {url}",
+                    }
+                _write_cached_url(url, text)
 
             # Truncate if too long (keep first 5000 chars for better coverage)
             if len(text) > 5000:
@@ -931,10 +1268,7 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
 
             # Generate fetch_id and store
             fetch_id = str(uuid.uuid4())[:8]
-            self.fetched_sources[fetch_id] = {
-                "url": url,
-                "text": text,
-            }
+            self._store_fetched_source(fetch_id, url, text)
 
             print(f"  ✓ Fetched {len(text)} characters (ID: {fetch_id})")
 
@@ -957,6 +1291,30 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
                 "message": f"Error fetching {url}: {str(e)}",
             }
 
+    def _store_fetched_source(self, fetch_id: str, url: str, text: str) -> None:
+        """Write fetched text to the on-disk fetch cache and record where it lives."""
+        FETCH_CACHE_DIR.mkdir(exist_ok=True)
+        path = FETCH_CACHE_DIR / f"{fetch_id}.txt"
+        path.write_text(text, encoding="utf-8", newline="")
+        with self._prep_lock:
+            self.fetched_sources[fetch_id] = {
+                "url": url,
+                "path": str(path),
+                "length": len(text),
+            }
+
+    def _discard_fetched_sources(self) -> None:
+        """Delete this session's fetched text from the fetch cache (the URL cache is kept)."""
+        with self._prep_lock:
+            for source in self.fetched_sources.values():
+                Path(source["path"]).unlink(missing_ok=True)
+            self.fetched_sources = {}
+
+    def _read_fetched_text(self, fetch_id: str) -> str:
+        """Read a fetched source's text back from the fetch cache."""
+        with open(self.fetched_sources[fetch_id]["path"], encoding="utf-8", newline="") as f:
+            return f.read()
+
     def _cut_card_skill(
         self,
         fetch_id: str,
@@ -975,9 +1333,124 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
 
         Like editing code - the tool extracts text between markers programmatically.
         """
-        from debate.evidence_storage import get_or_create_flat_debate_file, save_flat_debate_file
-        from debate.models import EvidenceType
+        return self._cut_cards_skill(
+            [
+                {
+                    "fetch_id": fetch_id,
+                    "start_phrase": start_phrase,
+                    "end_phrase": end_phrase,
+                    "tag": tag,
+                    "argument": argument,
+                    "purpose": purpose,
+                    "author": author,
+                    "credentials": credentials,
+                    "year": year,
+                    "source": source,
+                    "evidence_type": evidence_type,
+                }
+            ]
+        )["results"][0]
+
+    def _get_flat_file(self) -> FlatDebateFile:
+        """Return this resolution's flat debate file, reading it from disk only once.
+
+        Cuts mutate the cached copy in memory and persist by appending, so the
+        cached copy stays the source of truth until it is invalidated.
+        """
+        if self._flat_file is None or self._flat_file.resolution != self.resolution:
+            self._invalidate_flat_file()
+            self._flat_file, _ = get_or_create_flat_debate_file(self.resolution)
+        return self._flat_file
+
+    def _invalidate_flat_file(self) -> None:
+        """Drop the cached flat debate file after pending writes land (next access rereads it)."""
+        if self._flat_writer:
+            self._flat_writer.flush()
+        self._flat_file = None
+
+    def _cut_cards_skill(self, cuts: list[dict]) -> dict:
+        """Cut several cards in one pass.
+
+        Uses the cached flat debate file, builds the argument lookups once,
+        applies every cut, then appends the new cards to disk once - instead
+        of one load/scan/full rewrite per card.
+        """
+        with self._prep_lock:
+            flat_file = self._get_flat_file()
+
+            # Index existing argument files by (is_answer, casefolded key); first match wins
+            arg_index: dict[tuple[bool, str], ArgumentFile] = {}
+            for existing_arg in flat_file.get_arguments_for_side(self.side):
+                if existing_arg.is_answer:
+                    if existing_arg.answers_to_casefold:
+                        arg_index.setdefault((True, existing_arg.answers_to_casefold), existing_arg)
+                else:
+                    arg_index.setdefault((False, existing_arg.title_casefold), existing_arg)
+
+            prep_index: dict[str, ArgumentPrep] = {}
+            if self.prep_file:
+                for prep_arg in self.prep_file.arguments:
+                    prep_index.setdefault(prep_arg.claim, prep_arg)
+
+            new_cards: list[tuple[Side, ArgumentFile, str, Card]] = []
+            results = [
+                self._cut_one_card(
+                    flat_file,
+                    arg_index,
+                    prep_index,
+                    new_cards,
+                    fetch_id=cut.get("fetch_id", ""),
+                    start_phrase=cut.get("start_phrase", ""),
+                    end_phrase=cut.get("end_phrase", ""),
+                    tag=cut.get("tag", ""),
+                    argument=cut.get("argument", ""),
+                    purpose=cut.get("purpose", "support"),
+                    author=cut.get("author", ""),
+                    credentials=cut.get("credentials", ""),
+                    year=cut.get("year", ""),
+                    source=cut.get("source", ""),
+                    evidence_type=cut.get("evidence_type"),
+                )
+                for cut in cuts
+            ]
+
+            num_cut = len(new_cards)
+            if num_cut:
+                # Persist the whole batch at once, appending cards rather than rewriting the file.
+                # During prep this happens on the background writer so the tool call returns immediately.
+                if self._flat_writer:
+                    self._flat_writer.submit(flat_file, new_cards)
+                else:
+                    append_flat_debate_cards(flat_file, new_cards)
+
+            return {
+                "status": "success" if num_cut == len(results) else ("partial" if num_cut else "error"),
+                "cards_cut": num_cut,
+                "results": results,
+            }
+
+    def _cut_one_card(
+        self,
+        flat_file: FlatDebateFile,
+        arg_index: dict[tuple[bool, str], ArgumentFile],
+        prep_index: dict[str, ArgumentPrep],
+        new_cards: list[tuple[Side, ArgumentFile, str, Card]],
+        fetch_id: str,
+        start_phrase: str,
+        end_phrase: str,
+        tag: str,
+        argument: str,
+        purpose: str,
+        author: str,
+        credentials: str,
+        year: str,
+        source: str,
+        evidence_type: str | None = None,
+    ) -> dict:
+        """Extract one card into the in-memory flat file and prep file.
 
+        Does not save; successfully cut cards are recorded in new_cards for the caller to persist.
+        """
         # Get the fetched source
         if fetch_id not in self.fetched_sources:
             return {
@@ -985,9 +1458,15 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
                 "message": f"fetch_id '{fetch_id}' not found. Use fetch_source first.",
             }
 
-        source_data = self.fetched_sources[fetch_id]
-        full_text = source_data["text"]
-        url = source_data["url"]
+        # Very short start phrases (e.g. "The") match too early; ask for a better one before reading the source
+        if len(start_phrase.strip()) < _MIN_START_PHRASE_CHARS:
+            return {
+                "status": "error",
+                "message": f"Start phrase too short to locate reliably: '{start_phrase}'. Use a more specific phrase (3-10 words).",
+            }
+
+        url = self.fetched_sources[fetch_id]["url"]
+        full_text = self._read_fetched_text(fetch_id)
 
         # Find start and end positions
         start_idx = full_text.find(start_phrase)
@@ -1011,16 +1490,7 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
         print(f"  ✓ Extracted {len(extracted_text)} characters from fetch {fetch_id}")
 
         # Parse evidence type
-        evidence_type_enum = None
-        if evidence_type:
-            type_map = {
-                "statistical": EvidenceType.STATISTICAL,
-                "analytical": EvidenceType.ANALYTICAL,
-                "consensus": EvidenceType.CONSENSUS,
-                "empirical": EvidenceType.EMPIRICAL,
-                "predictive": EvidenceType.PREDICTIVE,
-            }
-            evidence_type_enum = type_map.get(evidence_type.lower())
+        evidence_type_enum = _EVIDENCE_TYPE_MAP.get(evidence_type.lower()) if evidence_type else None
 
         # Create card with extracted text (no bolding)
         card = Card(
@@ -1035,9 +1505,6 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
             evidence_type=evidence_type_enum,
         )
 
-        # Get or create flat debate file
-        flat_file, is_new = get_or_create_flat_debate_file(self.resolution)
-
         # Determine if this is an answer based on purpose or argument name
         is_answer = (
             purpose.lower() == "answer"
@@ -1059,26 +1526,13 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
                 answers_to = argument
                 argument_title = f"AT: {argument}"
 
-        # Find or create the argument file
-        arguments = flat_file.get_arguments_for_side(self.side)
-        arg_file = None
-
-        # Look for existing argument file
-        for existing_arg in arguments:
-            # Match by title or answers_to
-            if is_answer and existing_arg.is_answer:
-                if existing_arg.answers_to and answers_to and existing_arg.answers_to.lower() == answers_to.lower():
-                    arg_file = existing_arg
-                    break
-            elif not is_answer and not existing_arg.is_answer:
-                if existing_arg.title.lower() == argument_title.lower():
-                    arg_file = existing_arg
-                    break
+        # Find or create the argument file (match AT files by answers_to, others by title)
+        match_name = (answers_to or "") if is_answer else argument_title
+        arg_key = (is_answer, match_name.casefold())
+        arg_file = arg_index.get(arg_key) if answers_to or not is_answer else None
 
         # Create new argument file if not found
         if not arg_file:
-            from debate.models import ArgumentFile
-
             arg_file = ArgumentFile(
                 title=argument_title,
                 is_answer=is_answer,
@@ -1089,23 +1543,18 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
                 flat_file.pro_arguments.append(arg_file)
             else:
                 flat_file.con_arguments.append(arg_file)
+            arg_index.setdefault(arg_key, arg_file)
 
         # Find or create claim within the argument file
         # For now, use the card tag as the claim
         claim_cards = arg_file.find_or_create_claim(tag)
         claim_cards.cards.append(card)
-
-        # Save the flat debate file
-        save_flat_debate_file(flat_file)
+        new_cards.append((self.side, arg_file, claim_cards.semantic_category, card))
 
         # Add to prep file if available
         if self.prep_file:
             # Check if argument already exists in prep
-            existing_prep_arg: ArgumentPrep | None = None
-            for arg in self.prep_file.arguments:
-                if arg.claim == argument:
-                    existing_prep_arg = arg
-                    break
+            existing_prep_arg = prep_index.get(argument)
 
             if existing_prep_arg:
                 # Add card ID reference (note: flat structure doesn't use IDs the same way)
@@ -1121,6 +1570,7 @@ Keep it SHORT (max 8 lines). Just new branches and next research targets.""",
                     strategic_notes=f"Card: {tag}",
                 )
                 self.prep_file.add_argument(new_arg)
+                prep_index[argument] = new_arg
 
         print(f"  ✓ Cut card: {tag[:50]}...")
 
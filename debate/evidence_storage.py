@@ -28,11 +28,23 @@ This structure allows:
     - Direct file access for any card
 """
 
+import functools
 import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from pydantic import ValidationError
+
+from debate.filenames import sanitize_filename
 from debate.models import (
     ArgumentFile,
+    ArgumentSection,
     Card,
     ClaimCards,
     DebateFile,
@@ -44,6 +56,36 @@ from debate.models import (
 )
 
 
+def _write_text_atomic(path: Path, text: str, newline: str | None = None) -> None:
+    """Write text to path through a temporary file and a rename.
+
+    A reader (or a crash mid-write) sees either the old file or the new one,
+    never a truncated one. The temporary file gets a unique name in the same
+    directory, so concurrent writers of one path don't clobber each other's
+    half-written copy. newline is passed to open(), as in Path.write_text.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline=newline) as f:
+            f.write(text)
+        # mkstemp creates the file as 0600; keep the usual mode for a plain write
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_text_if_changed(path: Path, text: str) -> None:
+    """Atomically write text to path unless the file already holds exactly that text."""
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    _write_text_atomic(path, text)
+
+
 def get_evidence_dir() -> Path:
     """Get the evidence storage directory, creating it if needed."""
     evidence_dir = Path("evidence")
@@ -51,27 +93,6 @@ def get_evidence_dir() -> Path:
     return evidence_dir
 
 
-def sanitize_filename(text: str, max_length: int = 60) -> str:
-    """Convert text to a safe filename/directory name."""
-    safe = text.lower()
-    safe = safe.replace(" ", "_")
-    safe = safe.replace(":", "")
-    safe = safe.replace("/", "_")
-    safe = safe.replace("\\", "_")
-    safe = safe.replace("'", "")
-    safe = safe.replace('"', "")
-    safe = safe.replace(".", "")
-    safe = safe.replace(",", "")
-    # Keep only alphanumeric, underscore, hyphen
-    safe = "".join(c for c in safe if c.isalnum() or c in "_-")
-    # Remove consecutive underscores
-    while "__" in safe:
-        safe = safe.replace("__", "_")
-    # Strip leading/trailing underscores
-    safe = safe.strip("_")
-    return safe[:max_length]
-
-
 def get_resolution_dir(resolution: str) -> Path:
     """Get the directory for a resolution, creating it if needed."""
     evidence_dir = get_evidence_dir()
@@ -86,6 +107,15 @@ def get_section_type_dir(section_type: SectionType) -> str:
     return section_type.value  # support, answer, extension, impact
 
 
+# INDEX.md headings for each section type
+_SECTION_TYPE_LABELS: dict[SectionType, str] = {
+    SectionType.SUPPORT: "Supporting Evidence",
+    SectionType.ANSWER: "Answers",
+    SectionType.EXTENSION: "Extensions",
+    SectionType.IMPACT: "Impact Evidence",
+}
+
+
 def render_card_markdown(card: Card) -> str:
     """Render a card as a standalone markdown file."""
     lines = [
@@ -169,8 +199,7 @@ def save_debate_file(debate_file: DebateFile) -> str:
                 filepath = section_dir / filename
 
                 # Write the card file
-                with open(filepath, "w") as f:
-                    f.write(render_card_markdown(card))
+                filepath.write_text(render_card_markdown(card), encoding="utf-8")
 
                 saved_cards.add(card_id)
 
@@ -179,21 +208,13 @@ def save_debate_file(debate_file: DebateFile) -> str:
 
     # Generate and save INDEX.md
     index_content = generate_index_markdown(debate_file, resolution_dir)
-    index_path = resolution_dir / "INDEX.md"
-    with open(index_path, "w") as f:
-        f.write(index_content)
+    _write_text_if_changed(resolution_dir / "INDEX.md", index_content)
 
     # Also save a minimal JSON for programmatic loading
-    # (just metadata, cards are in the markdown files)
+    # (just metadata, cards are in the markdown files). It holds exactly the DebateFile's
+    # fields, so pydantic's compiled serializer writes it directly
     meta_path = resolution_dir / ".debate_meta.json"
-    meta = {
-        "resolution": debate_file.resolution,
-        "cards": {cid: card.model_dump() for cid, card in debate_file.cards.items()},
-        "pro_sections": [s.model_dump() for s in debate_file.pro_sections],
-        "con_sections": [s.model_dump() for s in debate_file.con_sections],
-    }
-    with open(meta_path, "w") as f:
-        json.dump(meta, f, indent=2)
+    _write_text_atomic(meta_path, debate_file.model_dump_json(indent=2))
 
     return str(resolution_dir)
 
@@ -221,24 +242,15 @@ def generate_index_markdown(debate_file: DebateFile, resolution_dir: Path) -> st
         lines.append("")
 
         # Group by section type
-        by_type = {}
+        by_type: defaultdict[SectionType, list[ArgumentSection]] = defaultdict(list)
         for section in sections:
-            if section.section_type not in by_type:
-                by_type[section.section_type] = []
             by_type[section.section_type].append(section)
 
-        type_labels = {
-            SectionType.SUPPORT: "Supporting Evidence",
-            SectionType.ANSWER: "Answers",
-            SectionType.EXTENSION: "Extensions",
-            SectionType.IMPACT: "Impact Evidence",
-        }
-
         for section_type in SectionType:
             if section_type not in by_type:
                 continue
 
-            lines.append(f"### {type_labels[section_type]}")
+            lines.append(f"### {_SECTION_TYPE_LABELS[section_type]}")
             lines.append(f"*`{side_name}/{section_type.value}/`*")
             lines.append("")
 
@@ -249,8 +261,7 @@ def generate_index_markdown(debate_file: DebateFile, resolution_dir: Path) -> st
                     if card:
                         filename = sanitize_filename(card.tag) + ".md"
                         filepath = f"{side_name}/{section_type.value}/{filename}"
-                        last_name = card.author.split()[-1]
-                        lines.append(f"- [{card.tag}]({filepath}) ({last_name} {card.year})")
+                        lines.append(f"- [{card.tag}]({filepath}) ({card.last_name} {card.year})")
                 lines.append("")
 
     render_side(debate_file.pro_sections, "pro", "PRO")
@@ -274,10 +285,7 @@ def load_debate_file(resolution: str) -> DebateFile | None:
     if not meta_path.exists():
         return None
 
-    with open(meta_path) as f:
-        meta = json.load(f)
-
-    return DebateFile.model_validate(meta)
+    return DebateFile.model_validate_json(meta_path.read_bytes())
 
 
 def get_or_create_debate_file(resolution: str) -> tuple[DebateFile, bool]:
@@ -298,63 +306,116 @@ def get_or_create_debate_file(resolution: str) -> tuple[DebateFile, bool]:
     return new_file, True
 
 
+# Per-directory listing summaries, keyed by the stat of the files they were read from
+LISTING_CACHE_NAME = ".listing_cache.json"
+
+# Most evidence files loaded at once when listing (loading is mostly file I/O)
+_LISTING_WORKERS = 8
+
+
+def _listing_signature(dir_path: Path) -> list:
+    """Return (mtime_ns, size) for each metadata file in a debate file directory, None where absent."""
+    signature: list = []
+    for name in (".debate_meta.json", ".flat_meta.json", FLAT_JOURNAL_NAME):
+        try:
+            stat = (dir_path / name).stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append([stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+def _summarize_debate_dir(dir_path: Path) -> dict | None:
+    """Load the debate file in dir_path and summarize it for listing, or None if there isn't a readable one."""
+    # Check for old format (.debate_meta.json)
+    old_meta_path = dir_path / ".debate_meta.json"
+    flat_meta_path = dir_path / ".flat_meta.json"
+
+    if old_meta_path.exists():
+        # Old format
+        try:
+            debate_file = load_debate_file(dir_path.name)
+            if debate_file:
+                return {
+                    "resolution": debate_file.resolution,
+                    "dir_path": str(dir_path),
+                    "num_cards": len(debate_file.cards),
+                    "num_pro_sections": len(debate_file.pro_sections),
+                    "num_con_sections": len(debate_file.con_sections),
+                    "format": "old",
+                }
+        except Exception:
+            return None
+    elif flat_meta_path.exists():
+        # New flat format
+        try:
+            flat_file = load_flat_debate_file(dir_path.name)
+            if flat_file:
+                # Count total cards across all arguments
+                total_cards = 0
+                for arg in flat_file.pro_arguments + flat_file.con_arguments:
+                    for group in arg.semantic_groups:
+                        total_cards += len(group.cards)
+
+                return {
+                    "resolution": flat_file.resolution,
+                    "dir_path": str(dir_path),
+                    "num_cards": total_cards,
+                    "num_pro_sections": len(flat_file.pro_arguments),
+                    "num_con_sections": len(flat_file.con_arguments),
+                    "format": "flat",
+                }
+        except Exception:
+            return None
+    return None
+
+
 def list_debate_files() -> list[dict]:
     """List all debate files (both old and new flat format).
 
+    Summaries are cached in evidence/.listing_cache.json. A debate file is only
+    loaded again when one of its metadata files has changed since it was last
+    summarized, so listing a large evidence directory costs a few stat calls
+    per resolution instead of parsing every card.
+
     Returns:
         List of dicts with resolution info
     """
     evidence_dir = get_evidence_dir()
-    files = []
-
-    for dir_path in evidence_dir.iterdir():
-        if not dir_path.is_dir():
-            continue
-
-        # Check for old format (.debate_meta.json)
-        old_meta_path = dir_path / ".debate_meta.json"
-        flat_meta_path = dir_path / ".flat_meta.json"
-
-        if old_meta_path.exists():
-            # Old format
-            try:
-                debate_file = load_debate_file(dir_path.name)
-                if debate_file:
-                    files.append(
-                        {
-                            "resolution": debate_file.resolution,
-                            "dir_path": str(dir_path),
-                            "num_cards": len(debate_file.cards),
-                            "num_pro_sections": len(debate_file.pro_sections),
-                            "num_con_sections": len(debate_file.con_sections),
-                            "format": "old",
-                        }
-                    )
-            except Exception:
-                continue
-        elif flat_meta_path.exists():
-            # New flat format
-            try:
-                flat_file = load_flat_debate_file(dir_path.name)
-                if flat_file:
-                    # Count total cards across all arguments
-                    total_cards = 0
-                    for arg in flat_file.pro_arguments + flat_file.con_arguments:
-                        for group in arg.semantic_groups:
-                            total_cards += len(group.cards)
-
-                    files.append(
-                        {
-                            "resolution": flat_file.resolution,
-                            "dir_path": str(dir_path),
-                            "num_cards": total_cards,
-                            "num_pro_sections": len(flat_file.pro_arguments),
-                            "num_con_sections": len(flat_file.con_arguments),
-                            "format": "flat",
-                        }
-                    )
-            except Exception:
-                continue
+    cache_path = evidence_dir / LISTING_CACHE_NAME
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = {}
+
+    # scandir reports which entries are directories without a stat call per entry
+    with os.scandir(evidence_dir) as entries:
+        dir_paths = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+    listing = {}
+    stale = []
+    for dir_path in dir_paths:
+        signature = _listing_signature(dir_path)
+        entry = cached.get(dir_path.name)
+        if entry is None or entry["signature"] != signature:
+            entry = {"signature": signature, "summary": None}
+            stale.append(dir_path)
+        listing[dir_path.name] = entry
+
+    # Only changed debate files are loaded, several at a time
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(len(stale), _LISTING_WORKERS)) as executor:
+            for dir_path, summary in zip(stale, executor.map(_summarize_debate_dir, stale), strict=True):
+                listing[dir_path.name]["summary"] = summary
+
+    files = [entry["summary"] for entry in listing.values() if entry["summary"]]
+
+    if listing != cached:
+        try:
+            _write_text_atomic(cache_path, json.dumps(listing))
+        except OSError:
+            pass  # Listing still works without the cache; it is just rebuilt next time
 
     return files
 
@@ -362,28 +423,23 @@ def list_debate_files() -> list[dict]:
 # --- Backwards compatibility functions for EvidenceBucket ---
 
 
-def save_evidence_bucket(bucket: EvidenceBucket) -> str:
-    """Save an evidence bucket to a JSON file (legacy format)."""
-    evidence_dir = get_evidence_dir()
-
-    resolution_slug = sanitize_filename(bucket.resolution)
-    side_slug = bucket.side.value
-    topic_slug = sanitize_filename(bucket.topic)
-    filename = f"{resolution_slug}_{side_slug}_{topic_slug}.json"
+@functools.lru_cache(maxsize=256)
+def _evidence_bucket_filename(resolution: str, side: Side, topic: str) -> str:
+    """Filename of the legacy evidence bucket for (resolution, side, topic)."""
+    return f"{sanitize_filename(resolution)}_{side.value}_{sanitize_filename(topic)}.json"
 
-    filepath = evidence_dir / filename
 
-    with open(filepath, "w") as f:
-        json.dump(bucket.model_dump(), f, indent=2)
+def save_evidence_bucket(bucket: EvidenceBucket) -> str:
+    """Save an evidence bucket to a JSON file (legacy format)."""
+    filepath = get_evidence_dir() / _evidence_bucket_filename(bucket.resolution, bucket.side, bucket.topic)
+    _write_text_atomic(filepath, bucket.model_dump_json(indent=2))
 
     return str(filepath)
 
 
 def load_evidence_bucket(filepath: str) -> EvidenceBucket:
     """Load an evidence bucket from a JSON file."""
-    with open(filepath) as f:
-        data = json.load(f)
-    return EvidenceBucket.model_validate(data)
+    return EvidenceBucket.model_validate_json(Path(filepath).read_bytes())
 
 
 def find_evidence_bucket(
@@ -392,31 +448,31 @@ def find_evidence_bucket(
     topic: str,
 ) -> EvidenceBucket | None:
     """Find and load an evidence bucket if it exists."""
-    evidence_dir = get_evidence_dir()
-
-    resolution_slug = sanitize_filename(resolution)
-    side_slug = side.value
-    topic_slug = sanitize_filename(topic)
-    filename = f"{resolution_slug}_{side_slug}_{topic_slug}.json"
-
-    filepath = evidence_dir / filename
-
-    if filepath.exists():
+    filepath = get_evidence_dir() / _evidence_bucket_filename(resolution, side, topic)
+    # Opening directly costs one syscall; checking exists() first would add a stat
+    try:
         return load_evidence_bucket(str(filepath))
-
-    return None
+    except FileNotFoundError:
+        return None
 
 
 def list_evidence_buckets(resolution: str | None = None) -> list[dict]:
     """List all evidence buckets, optionally filtered by resolution."""
     evidence_dir = get_evidence_dir()
-    buckets = []
+    filepaths = list(evidence_dir.glob("*.json"))
+    if not filepaths:
+        return []
 
-    for filepath in evidence_dir.glob("*.json"):
+    def load(filepath: Path) -> EvidenceBucket | None:
         try:
-            bucket = load_evidence_bucket(str(filepath))
+            return load_evidence_bucket(str(filepath))
+        except Exception:
+            return None
 
-            if resolution and bucket.resolution != resolution:
+    buckets = []
+    with ThreadPoolExecutor(max_workers=min(len(filepaths), _LISTING_WORKERS)) as executor:
+        for filepath, bucket in zip(filepaths, executor.map(load, filepaths), strict=True):
+            if bucket is None or (resolution and bucket.resolution != resolution):
                 continue
 
             buckets.append(
@@ -428,8 +484,6 @@ def list_evidence_buckets(resolution: str | None = None) -> list[dict]:
                     "num_cards": len(bucket.cards),
                 }
             )
-        except Exception:
-            continue
 
     return buckets
 
@@ -457,6 +511,12 @@ def get_or_create_evidence_bucket(
 
 # ========== Flat Evidence Structure ==========
 
+# Append-only journal of cards added since the last full .flat_meta.json save
+FLAT_JOURNAL_NAME = ".flat_cards.jsonl"
+
+# Journal size that triggers a full save (compaction) instead of another append
+FLAT_JOURNAL_COMPACT_BYTES = 1_000_000
+
 
 def render_argument_file_markdown(argument: ArgumentFile) -> str:
     """Render an argument file as markdown.
@@ -499,9 +559,8 @@ def render_argument_file_markdown(argument: ArgumentFile) -> str:
 
         for i, card in enumerate(semantic_group.cards, 1):
             # Card header (e.g., "1. Smith '24")
-            last_name = card.author.split()[-1]
             year_short = card.year[-2:] if len(card.year) >= 2 else card.year
-            lines.append(f"{i}. {last_name} '{year_short}")
+            lines.append(f"{i}. {card.last_name} '{year_short}")
             lines.append("")
 
             # Card tag (what it proves)
@@ -539,6 +598,7 @@ def save_flat_debate_file(debate_file: FlatDebateFile) -> str:
                 {argument}.md
                 at_{argument}.md
             .flat_meta.json
+            .flat_cards.jsonl           # Cards appended since the last full save
     """
     resolution_dir = get_resolution_dir(debate_file.resolution)
 
@@ -550,53 +610,217 @@ def save_flat_debate_file(debate_file: FlatDebateFile) -> str:
     # Save pro arguments
     for arg in debate_file.pro_arguments:
         filepath = resolution_dir / "pro" / arg.get_filename()
-        with open(filepath, "w") as f:
-            f.write(render_argument_file_markdown(arg))
+        filepath.write_text(render_argument_file_markdown(arg), encoding="utf-8")
 
     # Save con arguments
     for arg in debate_file.con_arguments:
         filepath = resolution_dir / "con" / arg.get_filename()
-        with open(filepath, "w") as f:
-            f.write(render_argument_file_markdown(arg))
+        filepath.write_text(render_argument_file_markdown(arg), encoding="utf-8")
 
     # Save metadata for programmatic loading
     meta_path = resolution_dir / ".flat_meta.json"
-    meta = {
-        "resolution": debate_file.resolution,
-        "pro_arguments": [_serialize_argument_file(arg) for arg in debate_file.pro_arguments],
-        "con_arguments": [_serialize_argument_file(arg) for arg in debate_file.con_arguments],
-    }
-    with open(meta_path, "w") as f:
-        json.dump(meta, f, indent=2)
+    _write_text_atomic(meta_path, debate_file.model_dump_json(indent=2))
+
+    # The snapshot now includes every journaled card
+    (resolution_dir / FLAT_JOURNAL_NAME).unlink(missing_ok=True)
 
     # Generate flat INDEX.md
     index_content = generate_flat_index_markdown(debate_file, resolution_dir)
-    index_path = resolution_dir / "INDEX.md"
-    with open(index_path, "w") as f:
-        f.write(index_content)
+    _write_text_if_changed(resolution_dir / "INDEX.md", index_content)
+
+    return str(resolution_dir)
+
+
+def append_flat_debate_cards(
+    debate_file: FlatDebateFile,
+    new_cards: list[tuple[Side, ArgumentFile, str, Card]],
+) -> str:
+    """Persist newly added cards without rewriting the whole flat debate file.
+
+    Each card is appended as one line to the .flat_cards.jsonl journal, which
+    load_flat_debate_file replays on top of .flat_meta.json. Only the argument
+    files that received cards (and INDEX.md) are re-rendered. Falls back to a
+    full save when there is no snapshot yet or the journal has grown large.
+
+    Args:
+        debate_file: The in-memory flat debate file (already containing new_cards)
+        new_cards: (side, argument file, semantic category, card) for each added card
+
+    Returns:
+        Path to the resolution directory
+    """
+    resolution_dir = get_resolution_dir(debate_file.resolution)
+    journal_path = resolution_dir / FLAT_JOURNAL_NAME
+    entries = [
+        {
+            "side": side.value,
+            "title": arg.title,
+            "is_answer": arg.is_answer,
+            "answers_to": arg.answers_to,
+            "purpose": arg.purpose,
+            "semantic_category": semantic_category,
+            "card": card.model_dump(mode="json"),
+        }
+        for side, arg, semantic_category, card in new_cards
+    ]
+
+    if not (resolution_dir / ".flat_meta.json").exists() or (
+        journal_path.exists() and journal_path.stat().st_size > FLAT_JOURNAL_COMPACT_BYTES
+    ):
+        # Fold into what is on disk rather than debate_file, which may predate cards other writers appended
+        on_disk = load_flat_debate_file(debate_file.resolution)
+        if on_disk is None:
+            return save_flat_debate_file(debate_file)
+        for entry in entries:
+            _apply_journal_entry(on_disk, entry)
+        return save_flat_debate_file(on_disk)
+
+    if not new_cards:
+        return str(resolution_dir)
+
+    with open(journal_path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+    # Re-render only the argument files that changed
+    touched = {id(arg): (side, arg) for side, arg, _, _ in new_cards}
+    for side, arg in touched.values():
+        side_dir = resolution_dir / side.value
+        side_dir.mkdir(exist_ok=True)
+        (side_dir / arg.get_filename()).write_text(render_argument_file_markdown(arg), encoding="utf-8")
+
+    index_content = generate_flat_index_markdown(debate_file, resolution_dir)
+    _write_text_if_changed(resolution_dir / "INDEX.md", index_content)
 
     return str(resolution_dir)
 
 
-def _serialize_argument_file(arg: ArgumentFile) -> dict:
-    """Serialize ArgumentFile for JSON storage."""
-    return {
-        "title": arg.title,
-        "is_answer": arg.is_answer,
-        "answers_to": arg.answers_to,
-        "purpose": arg.purpose,
-        "semantic_groups": [
-            {
-                "semantic_category": group.semantic_category,
-                "cards": [card.model_dump() for card in group.cards],
-            }
-            for group in arg.semantic_groups
-        ],
-    }
+def _apply_journal_entry(debate_file: FlatDebateFile, entry: dict) -> None:
+    """Replay one journaled card onto a loaded flat debate file."""
+    side = Side(entry["side"])
+    is_answer = entry.get("is_answer", False)
+    title_cf = entry["title"].casefold()
+
+    arg_file = None
+    for existing in debate_file.get_arguments_for_side(side):
+        if existing.is_answer == is_answer and existing.title_casefold == title_cf:
+            arg_file = existing
+            break
+
+    if arg_file is None:
+        arg_file = ArgumentFile(
+            title=entry["title"],
+            is_answer=is_answer,
+            answers_to=entry.get("answers_to"),
+            purpose=entry.get("purpose", ""),
+        )
+        debate_file.add_argument(side, arg_file)
+
+    category = entry.get("semantic_category", "")
+    group = next((g for g in arg_file.semantic_groups if g.semantic_category == category), None)
+    if group is None:
+        group = arg_file.add_semantic_group(category)
+    group.add_card(Card.model_validate(entry["card"]))
+
+
+def _snapshot_flat_debate_file(debate_file: FlatDebateFile) -> FlatDebateFile:
+    """Copy the argument/group structure so later appends don't race a background write.
+
+    Cards are never modified after they are cut, so they are shared rather than copied.
+    """
+
+    def copy_argument(arg: ArgumentFile) -> ArgumentFile:
+        groups = [group.model_copy(update={"cards": list(group.cards)}) for group in arg.semantic_groups]
+        return arg.model_copy(update={"semantic_groups": groups})
+
+    return debate_file.model_copy(
+        update={
+            "pro_arguments": [copy_argument(arg) for arg in debate_file.pro_arguments],
+            "con_arguments": [copy_argument(arg) for arg in debate_file.con_arguments],
+        }
+    )
+
+
+class FlatDebateFileWriter:
+    """Write-behind persistence for a flat debate file.
+
+    submit() snapshots the file and returns immediately; a daemon thread
+    coalesces everything queued since its last write into a single
+    append_flat_debate_cards call, writing at most once per min_interval.
+    Call flush() before reading the file back from disk.
+    """
+
+    def __init__(self, min_interval: float = 0.05):
+        """Start the background writer thread.
+
+        Args:
+            min_interval: Minimum seconds between writes (lets bursts coalesce)
+        """
+        self.min_interval = min_interval
+        self._queue: queue.Queue[tuple[FlatDebateFile, list[tuple[Side, int, str, Card]]] | None] = queue.Queue()
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, name="flat-debate-file-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, debate_file: FlatDebateFile, new_cards: list[tuple[Side, ArgumentFile, str, Card]]) -> None:
+        """Queue newly added cards for writing (see append_flat_debate_cards)."""
+        # Reference arguments by position: the snapshot holds copies, and arguments are only ever appended
+        positions = {id(arg): i for side in Side for i, arg in enumerate(debate_file.get_arguments_for_side(side))}
+        entries = [(side, positions[id(arg)], category, card) for side, arg, category, card in new_cards]
+        self._queue.put((_snapshot_flat_debate_file(debate_file), entries))
+
+    def flush(self) -> None:
+        """Block until every submitted write is on disk; re-raise a write failure."""
+        self._queue.join()
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    # Only close() enqueues None, after a flush; put it back for the outer loop
+                    self._queue.task_done()
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+
+            # The latest snapshot contains every card queued before it
+            snapshot = batch[-1][0]
+            new_cards = [
+                (side, snapshot.get_arguments_for_side(side)[position], category, card)
+                for _, entries in batch
+                for side, position, category, card in entries
+            ]
+            try:
+                append_flat_debate_cards(snapshot, new_cards)
+            except Exception as e:
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            time.sleep(self.min_interval)
 
 
 def _deserialize_argument_file(data: dict) -> ArgumentFile:
-    """Deserialize ArgumentFile from JSON."""
+    """Deserialize a legacy ArgumentFile ("claims"/"claim" keys, optional purpose) from JSON."""
     semantic_groups = []
 
     # Handle both old "claims" format and new "semantic_groups" format for backwards compatibility
@@ -684,14 +908,39 @@ def load_flat_debate_file(resolution: str) -> FlatDebateFile | None:
     if not meta_path.exists():
         return None
 
-    with open(meta_path) as f:
-        meta = json.load(f)
+    raw = meta_path.read_bytes()
+    debate_file = None
+    # Current snapshots validate straight from bytes; older ones used "claims"/"claim" keys
+    if b'"claims"' not in raw:
+        try:
+            debate_file = FlatDebateFile.model_validate_json(raw)
+        except ValidationError:
+            debate_file = None
+    if debate_file is None:
+        meta = json.loads(raw)
+        debate_file = FlatDebateFile(
+            resolution=meta["resolution"],
+            pro_arguments=[_deserialize_argument_file(a) for a in meta.get("pro_arguments", [])],
+            con_arguments=[_deserialize_argument_file(a) for a in meta.get("con_arguments", [])],
+        )
 
-    return FlatDebateFile(
-        resolution=meta["resolution"],
-        pro_arguments=[_deserialize_argument_file(a) for a in meta.get("pro_arguments", [])],
-        con_arguments=[_deserialize_argument_file(a) for a in meta.get("con_arguments", [])],
-    )
+    # Replay cards appended since the last full save. A crash after a full save writes the
+    # snapshot but before it removes the journal leaves entries the snapshot already holds; skip those by card ID
+    journal_path = resolution_dir / FLAT_JOURNAL_NAME
+    if journal_path.exists():
+        known_ids = {card.id for card in debate_file.get_all_cards()}
+        with open(journal_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                card_id = entry["card"].get("id")
+                if card_id in known_ids:
+                    continue
+                known_ids.add(card_id)
+                _apply_journal_entry(debate_file, entry)
+
+    return debate_file
 
 
 def get_or_create_flat_debate_file(resolution: str) -> tuple[FlatDebateFile, bool]:
@@ -191,10 +191,7 @@ class EvidenceValidator:
         cards = []
 
         for section in sections:
-            for card_id in section.card_ids:
-                card = self.debate_file.get_card(card_id)
-                if card:
-                    cards.append(card)
+            cards.extend(card for card in self.debate_file.get_cards(section.card_ids) if card)
 
         return cards
 
@@ -0,0 +1,29 @@
+"""Filename helpers shared by the models and evidence storage."""
+
+import functools
+import re
+import string
+
+# Spaces and path separators become underscores; punctuation that would read badly in a filename is dropped
+_FILENAME_TRANSLATION = str.maketrans(
+    {" ": "_", "/": "_", "\\": "_", ":": None, "'": None, '"': None, ".": None, ",": None}
+)
+_FILENAME_DISALLOWED = re.compile(r"[^\w-]")
+_REPEATED_UNDERSCORES = re.compile(r"__+")
+# Slugs made only of these (with no doubled or edge underscores) are already sanitized
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "_-")
+
+
+@functools.lru_cache(maxsize=1024)
+def sanitize_filename(text: str, max_length: int = 60) -> str:
+    """Convert text to a safe filename/directory name (memoized: the same names recur constantly)."""
+    if text and set(text) <= _SAFE_FILENAME_CHARS and "__" not in text and not (text[0] == "_" or text[-1] == "_"):
+        return text[:max_length]
+    safe = text.lower().translate(_FILENAME_TRANSLATION)
+    # Keep only alphanumeric, underscore, hyphen (\w is exactly str.isalnum() plus underscore)
+    safe = _FILENAME_DISALLOWED.sub("", safe)
+    # Remove consecutive underscores
+    safe = _REPEATED_UNDERSCORES.sub("_", safe)
+    # Strip leading/trailing underscores
+    safe = safe.strip("_")
+    return safe[:max_length]
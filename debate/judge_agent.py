@@ -1,14 +1,15 @@
 """AI judge for evaluating debate rounds and providing decisions."""
 
+import functools
 from pathlib import Path
 
-import anthropic
-
+from debate.client import get_client, print_stream
 from debate.models import JudgeDecision, RoundState
 
 
+@functools.lru_cache(maxsize=32)
 def load_prompt_template(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (read once per process)."""
     prompts_dir = Path(__file__).parent / "prompts"
     template_path = prompts_dir / f"{name}.md"
     return template_path.read_text()
@@ -27,7 +28,7 @@ class JudgeAgent:
 
     def __init__(self):
         """Initialize the judge agent."""
-        self.client = anthropic.Anthropic()
+        self.client = get_client()
 
     def judge_round(
         self,
@@ -56,7 +57,6 @@ class JudgeAgent:
         )
 
         if stream:
-            response_text = ""
             print("\n" + "=" * 60)
             print("JUDGE'S DECISION")
             print("=" * 60 + "\n")
@@ -65,9 +65,7 @@ class JudgeAgent:
                 max_tokens=8192,
                 messages=[{"role": "user", "content": prompt}],
             ) as stream_response:
-                for text in stream_response.text_stream:
-                    print(text, end="", flush=True)
-                    response_text += text
+                response_text = print_stream(stream_response.text_stream)
             print("\n")
         else:
             message = self.client.messages.create(
@@ -2,8 +2,11 @@
 
 import uuid
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from debate.filenames import sanitize_filename
 
 
 class Side(str, Enum):
@@ -105,6 +108,27 @@ class Card(BaseModel):
         default="", description="Semantic grouping for this card (heading-2 in markdown output)"
     )
 
+    # Derived citation name, recomputed whenever author changes
+    _last_name: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the cached citation name."""
+        self._refresh_last_name()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "author":
+            self._refresh_last_name()
+
+    def _refresh_last_name(self) -> None:
+        parts = self.author.split()
+        self._last_name = parts[-1] if parts else ""
+
+    @property
+    def last_name(self) -> str:
+        """Author's last name, as used in citations (e.g., 'Smith')."""
+        return self._last_name
+
     def format_for_reading(self) -> str:
         """Format the card for reading aloud in a speech (only bolded portions)."""
         import re
@@ -113,14 +137,12 @@ class Card(BaseModel):
         bolded_parts = re.findall(r"\*\*(.+?)\*\*", self.text)
         reading_text = " ".join(bolded_parts)
 
-        last_name = self.author.split()[-1]
-        return f"{last_name} {self.year} explains, {reading_text}"
+        return f"{self.last_name} {self.year} explains, {reading_text}"
 
     def format_full(self) -> str:
         """Format the full card with citation and credentials for reference."""
-        last_name = self.author.split()[-1]
         return (
-            f"[{last_name} {self.year}]\n"
+            f"[{self.last_name} {self.year}]\n"
             f"{self.author}, {self.credentials}\n"
             f"{self.source}, {self.year}\n"
             f"{self.url or '(no URL)'}\n\n"
@@ -178,6 +200,11 @@ class DebateFile(BaseModel):
         """Get a card by ID."""
         return self.cards.get(card_id)
 
+    def get_cards(self, card_ids: list[str]) -> list[Card | None]:
+        """Get cards for several IDs at once (None for unknown IDs), in the given order."""
+        cards = self.cards
+        return [cards.get(card_id) for card_id in card_ids]
+
     def add_to_section(
         self,
         side: Side,
@@ -229,8 +256,7 @@ class DebateFile(BaseModel):
                 for card_id in section.card_ids:
                     card = self.cards.get(card_id)
                     if card:
-                        last_name = card.author.split()[-1]
-                        lines.append(f"  - {card.tag} ({last_name} {card.year}) `[{card_id}]`")
+                        lines.append(f"  - {card.tag} ({card.last_name} {card.year}) `[{card_id}]`")
             lines.append("")
 
         # Con sections
@@ -244,8 +270,7 @@ class DebateFile(BaseModel):
                 for card_id in section.card_ids:
                     card = self.cards.get(card_id)
                     if card:
-                        last_name = card.author.split()[-1]
-                        lines.append(f"  - {card.tag} ({last_name} {card.year}) `[{card_id}]`")
+                        lines.append(f"  - {card.tag} ({card.last_name} {card.year}) `[{card_id}]`")
             lines.append("")
 
         return "\n".join(lines)
@@ -316,8 +341,7 @@ class EvidenceBucket(BaseModel):
         """Generate a table of contents listing all card tags."""
         lines = [f"Evidence Bucket: {self.topic}", "=" * 60, ""]
         for i, card in enumerate(self.cards, 1):
-            last_name = card.author.split()[-1]
-            lines.append(f"{i}. {card.tag} ({last_name} {card.year})")
+            lines.append(f"{i}. {card.tag} ({card.last_name} {card.year})")
         return "\n".join(lines)
 
     def find_cards_by_tag(self, search_term: str) -> list[Card]:
@@ -350,8 +374,20 @@ class Case(BaseModel):
         max_length=3,
     )
 
+    # Last format() output and the inputs it was rendered from
+    _format_cache: tuple[tuple, str] | None = PrivateAttr(default=None)
+
     def format(self) -> str:
-        """Format the full case for display."""
+        """Format the full case for display.
+
+        The rendered text is reused until the resolution, side or any contention's
+        title/content changes. Checking that is cheap because unchanged strings
+        compare by identity.
+        """
+        key = (self.resolution, self.side, tuple((c.title, c.content) for c in self.contentions))
+        if self._format_cache is not None and self._format_cache[0] == key:
+            return self._format_cache[1]
+
         side_label = "AFFIRMATIVE" if self.side == Side.PRO else "NEGATIVE"
         lines = [
             f"{'=' * 60}",
@@ -367,7 +403,9 @@ class Case(BaseModel):
             lines.append(contention.content)
             lines.append("")
 
-        return "\n".join(lines)
+        formatted = "\n".join(lines)
+        self._format_cache = (key, formatted)
+        return formatted
 
 
 class Speech(BaseModel):
@@ -582,6 +620,37 @@ class ArgumentFile(BaseModel):
         default_factory=list, description="Semantic groups with their supporting cards"
     )
 
+    # Derived lookup keys, recomputed whenever title/answers_to/is_answer change
+    _title_cf: str = PrivateAttr(default="")
+    _answers_to_cf: str | None = PrivateAttr(default=None)
+    _filename: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the cached lookup keys."""
+        self._refresh_keys()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("title", "answers_to", "is_answer"):
+            self._refresh_keys()
+
+    def _refresh_keys(self) -> None:
+        self._title_cf = self.title.casefold()
+        self._answers_to_cf = self.answers_to.casefold() if self.answers_to else None
+        prefix = "at_" if self.is_answer else ""
+        base = self.answers_to if self.is_answer and self.answers_to else self.title
+        self._filename = f"{prefix}{sanitize_filename(base)}.md"
+
+    @property
+    def title_casefold(self) -> str:
+        """Casefolded title for case-insensitive matching."""
+        return self._title_cf
+
+    @property
+    def answers_to_casefold(self) -> str | None:
+        """Casefolded answers_to for case-insensitive matching."""
+        return self._answers_to_cf
+
     # Keep claims as deprecated alias for backwards compatibility
     @property
     def claims(self) -> list[SemanticGroup]:
@@ -624,11 +693,7 @@ class ArgumentFile(BaseModel):
 
     def get_filename(self) -> str:
         """Generate filename for this argument."""
-        from debate.evidence_storage import sanitize_filename
-
-        prefix = "at_" if self.is_answer else ""
-        base = self.answers_to if self.is_answer and self.answers_to else self.title
-        return f"{prefix}{sanitize_filename(base)}.md"
+        return self._filename
 
 
 class FlatDebateFile(BaseModel):
@@ -656,9 +721,9 @@ class FlatDebateFile(BaseModel):
     def find_argument(self, side: Side, title: str) -> ArgumentFile | None:
         """Find an argument by title."""
         args = self.get_arguments_for_side(side)
-        title_lower = title.lower()
+        title_cf = title.casefold()
         for arg in args:
-            if title_lower in arg.title.lower():
+            if title_cf in arg.title_casefold:
                 return arg
         return None
 
@@ -754,6 +819,14 @@ class FlatDebateFile(BaseModel):
                 return card
         return None
 
+    def get_cards(self, card_ids: list[str]) -> list[Card | None]:
+        """Get cards for several IDs at once (None for unknown IDs), in the given order.
+
+        Builds the ID lookup once, rather than scanning every argument per ID like get_card.
+        """
+        cards = self.cards
+        return [cards.get(card_id) for card_id in card_ids]
+
     def get_sections_for_side(self, side: Side) -> list["ArgumentSection"]:
         """Get sections for a side (backwards compatibility).
 
@@ -8,16 +8,18 @@ This module provides cost-effective evidence research by:
 
 import asyncio
 import datetime
+import functools
 import json
 import os
 import re
+import threading
 import time
 from pathlib import Path
 
-import anthropic
 import requests
 
 from debate.article_fetcher import FetchedArticle, fetch_all_sources_async, fetch_source
+from debate.client import get_client, print_stream
 from debate.config import Config
 from debate.models import (
     Card,
@@ -31,9 +33,15 @@ from debate.models import (
     Side,
 )
 
+# Brave's free tier allows one search per second; every search in the process shares this spacing
+_BRAVE_MIN_INTERVAL = 1.0
+_brave_lock = threading.Lock()
+_brave_last_call = 0.0
 
+
+@functools.lru_cache(maxsize=32)
 def load_prompt_template(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (read once per process)."""
     prompt_path = os.path.join(os.path.dirname(__file__), "prompts", f"{name}.md")
     with open(prompt_path) as f:
         return f.read()
@@ -67,6 +75,16 @@ def load_lessons(*lesson_names: str) -> str:
     return "\n\n---\n\n".join(lessons)
 
 
+def _wait_for_brave_slot() -> None:
+    """Sleep only as long as needed to keep Brave searches _BRAVE_MIN_INTERVAL apart."""
+    global _brave_last_call
+    with _brave_lock:
+        wait = _BRAVE_MIN_INTERVAL - (time.monotonic() - _brave_last_call)
+        if wait > 0:
+            time.sleep(wait)
+        _brave_last_call = time.monotonic()
+
+
 def _brave_search(
     query: str, num_results: int = 20, retry_on_rate_limit: bool = True, quiet: bool = False
 ) -> str | None:
@@ -90,6 +108,7 @@ def _brave_search(
     retry_count = 0
 
     while retry_count <= max_retries:
+        _wait_for_brave_slot()
         try:
             headers = {"X-Subscription-Token": api_key, "Accept": "application/json"}
             params = {"q": query, "count": num_results}
@@ -589,10 +608,6 @@ def research_evidence(
             for i, q in enumerate(queries, 1):
                 print(f"  [{i}/{len(queries)}] {q['strategy'].value}: {q['query'][:60]}...")
 
-                # Rate limit: 3-second pause between searches
-                if i > 1:
-                    time.sleep(3)
-
                 result = _brave_search(q["query"], num_results=20, quiet=False)
                 if result:
                     all_search_results.append(result)
@@ -629,9 +644,6 @@ def research_evidence(
 
         print("Searching Brave for relevant sources...")
 
-        # Add 3-second pause to avoid rate limiting
-        time.sleep(3)
-
         brave_results = _brave_search(search_query, num_results=20)
 
         if brave_results:
@@ -688,7 +700,7 @@ def research_evidence(
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = get_client()
 
     config = Config()
     model = config.get_agent_model("research")
@@ -697,15 +709,12 @@ def research_evidence(
     if stream:
         # Stream the response
         print("\nCutting evidence cards...\n")
-        response_text = ""
         with client.messages.stream(
             model=model,
             max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}],
         ) as stream_response:
-            for text in stream_response.text_stream:
-                print(text, end="", flush=True)
-                response_text += text
+            response_text = print_stream(stream_response.text_stream)
         print()  # Add newline after streaming
     else:
         # Non-streaming response
@@ -857,9 +866,6 @@ def research_evidence_efficient(
     print(f"Searching for: {topic}")
     print(f"  Query: {search_query[:70]}...")
 
-    # Add 3-second pause to avoid rate limiting
-    time.sleep(3)
-
     brave_results = _brave_search(search_query, num_results=20)
 
     if not brave_results:
@@ -885,7 +891,7 @@ def research_evidence_efficient(
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = get_client()
 
     config = Config()
     model = config.get_agent_model("research")
@@ -935,14 +941,12 @@ Output ONLY the marked-up card. Do not include explanations."""
 
     # Get markup from LLM (streaming)
     print("  Extracting and marking up...")
-    response_text = ""
     with client.messages.stream(
         model=model,
         max_tokens=1024,  # Smaller than full extraction
         messages=[{"role": "user", "content": markup_prompt}],
     ) as stream:
-        for text in stream.text_stream:
-            response_text += text
+        response_text = "".join(stream.text_stream)
 
     # Save marked-up text
     temp_file.write_text(response_text)
@@ -1174,7 +1178,7 @@ def build_prep_state_from_debate_file(
         # Old structure
         sections = debate_file.get_sections_for_side(side)
         for section in sections:
-            cards = [c for cid in section.card_ids if (c := debate_file.get_card(cid)) is not None]
+            cards = [c for c in debate_file.get_cards(section.card_ids) if c is not None]
             evidence_types = {c.evidence_type for c in cards if c.evidence_type}
 
             state.update_argument(section.argument, len(cards), evidence_types)
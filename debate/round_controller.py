@@ -1,5 +1,7 @@
 """Round controller for managing debate flow and speech order."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from rich.console import Console
 
 from debate.debate_agent import DebateAgent
@@ -110,29 +112,42 @@ class RoundController:
         console.print("=" * 60)
         console.print()
 
-        # Generate AI's case if not provided (user will deliver theirs as a speech)
-        if not self.round_state.team_b_case:
-            print("\nGenerating AI opponent's case...\n")
-            self.round_state.team_b_case = self._generate_case(self.ai_side)
-
-        # Run through speech order
-        speech_index = 0
-        for i, (team, speaker_num, speech_type, time_seconds) in enumerate(SPEECH_ORDER):
-            # Check for crossfire before certain speeches
-            if i == 2:  # After constructives
-                self._run_crossfire("first", 180)
-            elif i == 4:  # After rebuttals
-                self._run_crossfire("second", 180)
-            elif i == 6:  # After summaries
-                self._run_crossfire("grand", 180)
-
-            # Deliver speech
-            if team == "A":  # User's turn
-                self._user_speech(speech_type, speaker_num, time_seconds)
-            else:  # AI's turn
-                self._ai_speech(speech_type, speaker_num, time_seconds)
-
-            speech_index += 1
+        # Shut down without waiting, so an interrupt during the user's speech isn't held up
+        # by the background case (a with-block would join it first)
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            # Generate AI's case if not provided (user will deliver theirs as a speech). It isn't
+            # needed until the AI's constructive, so it is written while the user gives theirs
+            pending_case = None
+            if not self.round_state.team_b_case:
+                print("\nThe AI opponent is writing its case in the background...\n")
+                pending_case = executor.submit(self._generate_case, self.ai_side, stream=False)
+
+            # Run through speech order
+            speech_index = 0
+            for i, (team, speaker_num, speech_type, time_seconds) in enumerate(SPEECH_ORDER):
+                # Check for crossfire before certain speeches
+                if i == 2:  # After constructives
+                    self._run_crossfire("first", 180)
+                elif i == 4:  # After rebuttals
+                    self._run_crossfire("second", 180)
+                elif i == 6:  # After summaries
+                    self._run_crossfire("grand", 180)
+
+                # Deliver speech
+                if team == "A":  # User's turn
+                    self._user_speech(speech_type, speaker_num, time_seconds)
+                else:  # AI's turn
+                    if pending_case is not None:
+                        if not pending_case.done():
+                            print("\nWaiting for the AI opponent to finish its case...\n")
+                        self.round_state.team_b_case = pending_case.result()
+                        pending_case = None
+                    self._ai_speech(speech_type, speaker_num, time_seconds)
+
+                speech_index += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Judge the round
         print("\n\nThe round is complete. The judge is now deliberating...\n")
@@ -140,7 +155,7 @@ class RoundController:
 
         return decision
 
-    def _generate_case(self, side: Side) -> Case:
+    def _generate_case(self, side: Side, stream: bool = True) -> Case:
         """Generate a case for the specified side."""
         if side == self.user_side:
             # For user, just use case generator directly
@@ -150,13 +165,13 @@ class RoundController:
                 resolution=self.resolution,
                 side=side,
                 evidence_buckets=None,  # User can research evidence separately
-                stream=True,
+                stream=stream,
             )
         else:
             # For AI, use the debate agent
             return self.ai_agent.generate_case(
                 debate_file=self.debate_file,
-                stream=True,
+                stream=stream,
             )
 
     def _user_speech(self, speech_type: SpeechType, speaker_num: int, time_seconds: int):
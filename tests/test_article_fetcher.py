@@ -0,0 +1,58 @@
+"""Tests for article text extraction."""
+
+import debate.article_fetcher as article_fetcher
+from debate.article_fetcher import _fast_extract, extract_article_text
+
+PARAGRAPH = "TikTok's ban in India removed the app for 200 million users, and domestic alternatives filled the gap. "
+
+
+def _page(body: str) -> str:
+    return f"<html><head><script>var x = 1;</script></head><body><nav>Home | About</nav>{body}</body></html>"
+
+
+class TestFastExtract:
+    def test_uses_article_element(self):
+        html = _page(f"<div>Sidebar links</div><article><p>{PARAGRAPH * 3}</p><p>{PARAGRAPH * 3}</p></article>")
+        text = _fast_extract(html)
+        assert text is not None
+        assert text.startswith("TikTok's ban")
+        assert "Sidebar links" not in text
+        assert "Home | About" not in text
+
+    def test_rejects_short_pages(self):
+        assert _fast_extract(_page("<article><p>Too short.</p></article>")) is None
+
+    def test_skips_pages_without_article_or_main(self):
+        html = _page(
+            '<div class="sidebar"><p>Subscribe to our newsletter for daily updates and exclusive offers.</p></div>'
+            f'<div class="content"><p>{PARAGRAPH * 6}</p></div>'
+            f'<div class="comments"><p>{"Great article, thanks for sharing! " * 10}</p></div>'
+        )
+        assert _fast_extract(html) is None
+
+    def test_rejects_link_heavy_main(self):
+        links = "".join(f'<li><a href="/topic/{i}">Related story number {i} about TikTok</a></li>' for i in range(40))
+        assert _fast_extract(_page(f"<main><ul>{links}</ul><p>{PARAGRAPH * 2}</p></main>")) is None
+
+    def test_rejects_unparseable_input(self):
+        assert _fast_extract("") is None
+
+
+class TestExtractArticleText:
+    def test_prefers_fast_path(self):
+        html = _page(f"<main><p>{PARAGRAPH * 6}</p></main>")
+        assert extract_article_text(html) == _fast_extract(html)
+
+    def test_full_trafilatura_cascade_only_when_fast_mode_finds_nothing(self, monkeypatch):
+        calls = []
+
+        def fake_extract(html, fast=False, **kwargs):
+            calls.append(fast)
+            return None if fast else "full"
+
+        monkeypatch.setattr(article_fetcher.trafilatura, "extract", fake_extract)
+        assert extract_article_text(_page("<p>Too short.</p>")) == "full"
+        assert calls == [True, False]
+
+        monkeypatch.setattr(article_fetcher.trafilatura, "extract", lambda html, fast=False, **kwargs: "fast")
+        assert extract_article_text(_page("<p>Too short.</p>")) == "fast"
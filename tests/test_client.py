@@ -0,0 +1,43 @@
+"""Tests for the shared Anthropic client and streaming helpers."""
+
+import io
+import sys
+
+import debate.client as client_module
+from debate.client import get_client, print_stream
+from debate.debate_agent import DebateAgent
+from debate.judge_agent import JudgeAgent
+from debate.models import Side
+
+
+class TestGetClient:
+    def test_agents_share_one_client(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        get_client.cache_clear()
+
+        pro = DebateAgent(side=Side.PRO, resolution="Resolved: Test")
+        con = DebateAgent(side=Side.CON, resolution="Resolved: Test")
+
+        assert pro.client is con.client is JudgeAgent().client is get_client()
+        get_client.cache_clear()
+
+
+class TestPrintStream:
+    def test_returns_and_echoes_full_text(self, capsys):
+        assert print_stream(["Hello", ", ", "world"]) == "Hello, world"
+        assert capsys.readouterr().out == "Hello, world"
+
+    def test_batches_flushes(self, monkeypatch):
+        class CountingOut(io.StringIO):
+            flushes = 0
+
+            def flush(self):
+                CountingOut.flushes += 1
+
+        monkeypatch.setattr(sys, "stdout", CountingOut())
+        monkeypatch.setattr(client_module.time, "monotonic", lambda: 0.0)
+
+        print_stream(["ab"] * 100)
+
+        # 200 chars in 64-char batches, plus the final partial batch
+        assert CountingOut.flushes == 4
@@ -0,0 +1,198 @@
+"""Tests for cutting cards from fetched sources during autonomous prep."""
+
+import pytest
+
+from debate.debate_agent import DebateAgent
+from debate.evidence_storage import FlatDebateFileWriter, load_flat_debate_file
+from debate.models import PrepFile, Side
+
+RESOLUTION = "Resolved: The US should ban TikTok"
+SOURCE_TEXT = (
+    "India's 2020 ban on TikTok removed the app for 200 million users. "
+    "Domestic alternatives filled the gap within months. "
+    "Analysts found democratic nations can successfully execute platform bans. "
+    "Critics argue bans chill speech and harm small creators who rely on the platform."
+)
+
+CARD_FIELDS = {
+    "purpose": "support",
+    "author": "Jane Doe",
+    "credentials": "Professor of Law",
+    "year": "2024",
+    "source": "Law Review",
+}
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    agent = DebateAgent(side=Side.PRO, resolution=RESOLUTION)
+    agent.prep_file = PrepFile(resolution=RESOLUTION, side=Side.PRO)
+    agent._store_fetched_source("a7f3", "https://example.com/ban", SOURCE_TEXT)
+    return agent
+
+
+class TestCutCard:
+    def test_extracts_between_phrases(self, agent):
+        result = agent._cut_card_skill(
+            fetch_id="a7f3",
+            start_phrase="India's 2020 ban",
+            end_phrase="execute platform bans.",
+            tag="Bans are feasible",
+            argument="TikTok ban is feasible",
+            **CARD_FIELDS,
+        )
+        assert result["status"] == "success"
+
+        flat_file = load_flat_debate_file(RESOLUTION)
+        card = flat_file.pro_arguments[0].get_all_cards()[0]
+        assert card.text.startswith("India's 2020 ban")
+        assert card.text.endswith("execute platform bans.")
+
+    def test_unknown_fetch_id(self, agent):
+        result = agent._cut_card_skill(
+            fetch_id="missing",
+            start_phrase="India's 2020 ban",
+            end_phrase="execute platform bans.",
+            tag="Bans are feasible",
+            argument="TikTok ban is feasible",
+            **CARD_FIELDS,
+        )
+        assert result["status"] == "error"
+
+
+class TestCutCards:
+    def test_batch_groups_into_one_argument(self, agent):
+        result = agent._cut_cards_skill(
+            [
+                {
+                    "fetch_id": "a7f3",
+                    "start_phrase": "India's 2020 ban",
+                    "end_phrase": "200 million users.",
+                    "tag": "India banned TikTok",
+                    "argument": "TikTok ban is feasible",
+                    **CARD_FIELDS,
+                },
+                {
+                    "fetch_id": "a7f3",
+                    "start_phrase": "Domestic alternatives",
+                    "end_phrase": "within months.",
+                    "tag": "Alternatives replace TikTok",
+                    "argument": "TikTok ban is feasible",
+                    **CARD_FIELDS,
+                },
+            ]
+        )
+        assert result["status"] == "success"
+        assert result["cards_cut"] == 2
+
+        flat_file = load_flat_debate_file(RESOLUTION)
+        assert len(flat_file.pro_arguments) == 1
+        assert len(flat_file.pro_arguments[0].get_all_cards()) == 2
+        assert len(agent.prep_file.arguments) == 1
+
+    def test_batch_reports_partial_failure(self, agent):
+        result = agent._cut_cards_skill(
+            [
+                {
+                    "fetch_id": "a7f3",
+                    "start_phrase": "Critics argue",
+                    "end_phrase": "small creators",
+                    "tag": "Bans chill speech",
+                    "argument": "AT: TikTok ban protects users",
+                    **CARD_FIELDS,
+                },
+                {
+                    "fetch_id": "a7f3",
+                    "start_phrase": "not in the text",
+                    "end_phrase": "small creators",
+                    "tag": "Bans chill speech",
+                    "argument": "AT: TikTok ban protects users",
+                    **CARD_FIELDS,
+                },
+            ]
+        )
+        assert result["status"] == "partial"
+        assert [r["status"] for r in result["results"]] == ["success", "error"]
+
+        flat_file = load_flat_debate_file(RESOLUTION)
+        assert flat_file.pro_arguments[0].is_answer
+        assert flat_file.pro_arguments[0].answers_to == "TikTok ban protects users"
+
+    def test_background_writer_persists_batches(self, agent):
+        agent._flat_writer = FlatDebateFileWriter()
+        for start, end in [("India's 2020 ban", "200 million users."), ("Domestic alternatives", "within months.")]:
+            agent._cut_card_skill(
+                fetch_id="a7f3",
+                start_phrase=start,
+                end_phrase=end,
+                tag=f"Card from {start}",
+                argument="TikTok ban is feasible",
+                **CARD_FIELDS,
+            )
+        agent._flat_writer.close()
+
+        flat_file = load_flat_debate_file(RESOLUTION)
+        assert len(flat_file.get_all_cards()) == 2
+
+    def test_flat_file_is_read_from_disk_once(self, agent, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        loads = []
+        original = debate_agent.get_or_create_flat_debate_file
+
+        def counting_load(resolution):
+            loads.append(resolution)
+            return original(resolution)
+
+        monkeypatch.setattr(debate_agent, "get_or_create_flat_debate_file", counting_load)
+        for start, end in [("India's 2020 ban", "200 million users."), ("Domestic alternatives", "within months.")]:
+            agent._cut_card_skill(
+                fetch_id="a7f3",
+                start_phrase=start,
+                end_phrase=end,
+                tag=f"Card from {start}",
+                argument="TikTok ban is feasible",
+                **CARD_FIELDS,
+            )
+
+        assert loads == [RESOLUTION]
+        assert len(load_flat_debate_file(RESOLUTION).get_all_cards()) == 2
+
+    def test_short_start_phrase_is_rejected(self, agent, monkeypatch):
+        reads = []
+        monkeypatch.setattr(agent, "_read_fetched_text", lambda fetch_id: reads.append(fetch_id) or "")
+        result = agent._cut_card_skill(
+            fetch_id="a7f3",
+            start_phrase="The",
+            end_phrase="execute platform bans.",
+            tag="Bans are feasible",
+            argument="TikTok ban is feasible",
+            **CARD_FIELDS,
+        )
+        assert result["status"] == "error"
+        assert "too short" in result["message"]
+        assert reads == []
+
+    def test_parallel_dispatch_keeps_every_card(self, agent):
+        from concurrent.futures import ThreadPoolExecutor
+
+        agent._flat_writer = FlatDebateFileWriter()
+        cut = {"fetch_id": "a7f3", "end_phrase": "within months.", "argument": "TikTok ban is feasible", **CARD_FIELDS}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda i: agent._dispatch_tool(
+                        "cut_card", {**cut, "start_phrase": "Domestic alternatives", "tag": f"Card {i}"}
+                    ),
+                    range(8),
+                )
+            )
+        agent._flat_writer.close()
+
+        assert [r["status"] for r in results] == ["success"] * 8
+        assert len(load_flat_debate_file(RESOLUTION).get_all_cards()) == 8
+
+    def test_unknown_tool(self, agent):
+        assert agent._dispatch_tool("bogus", {}) == {"error": "Unknown tool: bogus"}
@@ -0,0 +1,574 @@
+"""Tests for DebateAgent speech and crossfire prompting."""
+
+import copy
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from debate.debate_agent import DebateAgent, load_prompt_template
+from debate.models import (
+    Card,
+    Case,
+    Contention,
+    DebateFile,
+    FlatDebateFile,
+    RoundState,
+    SectionType,
+    Side,
+    Speech,
+    SpeechType,
+)
+
+RESOLUTION = "Resolved: The US should ban TikTok"
+
+
+class FakeMessages:
+    """Records messages.create calls and returns a canned reply."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text="reply")])
+
+
+def _case(side: Side) -> Case:
+    return Case(
+        resolution=RESOLUTION,
+        side=side,
+        contentions=[
+            Contention(title="Contention 1: Security", content=f"{side.value} security argument"),
+            Contention(title="Contention 2: Economy", content=f"{side.value} economy argument"),
+        ],
+    )
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    agent = DebateAgent(side=Side.CON, resolution=RESOLUTION)
+    agent.client = SimpleNamespace(messages=FakeMessages())
+    return agent
+
+
+@pytest.fixture
+def round_state():
+    return RoundState(
+        resolution=RESOLUTION,
+        team_a_side=Side.PRO,
+        team_b_side=Side.CON,
+        team_a_case=_case(Side.PRO),
+        team_b_case=_case(Side.CON),
+    )
+
+
+class TestPromptCaching:
+    def test_speech_splits_static_system_from_request(self, agent, round_state):
+        agent.generate_speech("Rebuttal goal", round_state, time_limit_seconds=240, stream=False)
+
+        call = agent.client.messages.calls[0]
+        system_block = call["system"][0]
+        assert system_block["cache_control"] == {"type": "ephemeral"}
+        assert RESOLUTION in system_block["text"]
+        assert "Rebuttal goal" not in system_block["text"]
+        assert "Rebuttal goal" in call["messages"][0]["content"]
+
+    def test_crossfire_answer_keeps_question_out_of_system(self, agent, round_state):
+        answer = agent.answer_crossfire_question("Why ban it?", round_state, stream=False)
+
+        assert answer == "reply"
+        call = agent.client.messages.calls[0]
+        assert "con security argument" in call["system"][0]["text"]
+        assert "Why ban it?" not in call["system"][0]["text"]
+        assert "Why ban it?" in call["messages"][0]["content"]
+
+    def test_crossfire_question_and_answer_share_system_prompt(self, agent, round_state):
+        agent.ask_crossfire_question(round_state, stream=False)
+        agent.answer_crossfire_question("Why ban it?", round_state, stream=False)
+
+        first, second = agent.client.messages.calls
+        assert first["system"] == second["system"]
+
+    def test_speech_evidence_is_a_second_cached_system_block(self, agent, round_state):
+        debate_file = DebateFile(resolution=RESOLUTION)
+        card = Card(
+            tag="Ban harms creators",
+            author="Jane Doe",
+            credentials="Professor",
+            year="2024",
+            source="Law Review",
+            text="Creators lose income.",
+        )
+        debate_file.add_card(card)
+        debate_file.add_to_section(Side.CON, SectionType.SUPPORT, "Creator economy", card.id)
+
+        agent.generate_speech("Rebuttal goal", round_state, 240, debate_file=debate_file, stream=False)
+
+        call = agent.client.messages.calls[0]
+        assert len(call["system"]) == 2
+        assert "Ban harms creators" in call["system"][1]["text"]
+        assert call["system"][1]["cache_control"] == {"type": "ephemeral"}
+        assert "Ban harms creators" not in call["messages"][0]["content"]
+
+    def test_speech_without_evidence_has_single_system_block(self, agent, round_state):
+        agent.generate_speech("Rebuttal goal", round_state, 240, stream=False)
+
+        assert len(agent.client.messages.calls[0]["system"]) == 1
+
+    def test_speech_with_only_empty_sections_has_single_system_block(self, agent, round_state):
+        debate_file = DebateFile(resolution=RESOLUTION)
+        debate_file.add_to_section(Side.CON, SectionType.SUPPORT, "Creator economy", "missing-card")
+
+        agent.generate_speech("Rebuttal goal", round_state, 240, debate_file=debate_file, stream=False)
+
+        assert len(agent.client.messages.calls[0]["system"]) == 1
+
+
+class TestResponseCache:
+    def test_repeated_crossfire_question_hits_cache(self, agent, round_state):
+        first = agent.answer_crossfire_question("Why ban it?", round_state, stream=False)
+        second = agent.answer_crossfire_question("Why ban it?", round_state, stream=False)
+
+        assert first == second == "reply"
+        assert len(agent.client.messages.calls) == 1
+
+    def test_different_question_misses_cache(self, agent, round_state):
+        agent.answer_crossfire_question("Why ban it?", round_state, stream=False)
+        agent.answer_crossfire_question("Who enforces it?", round_state, stream=False)
+
+        assert len(agent.client.messages.calls) == 2
+
+    def test_asked_questions_are_not_cached(self, agent, round_state):
+        agent.ask_crossfire_question(round_state, stream=False)
+        agent.ask_crossfire_question(round_state, stream=False)
+
+        assert len(agent.client.messages.calls) == 2
+
+    def test_clear_cache(self, agent, round_state):
+        agent.answer_crossfire_question("Why ban it?", round_state, stream=False)
+        agent.clear_cache()
+        agent.answer_crossfire_question("Why ban it?", round_state, stream=False)
+
+        assert len(agent.client.messages.calls) == 2
+
+
+class TestLoadPromptTemplate:
+    def test_template_is_read_once(self):
+        load_prompt_template.cache_clear()
+        first = load_prompt_template("speech_generation")
+        second = load_prompt_template("speech_generation")
+
+        assert first is second
+        assert load_prompt_template.cache_info().misses == 1
+
+
+class ScriptedStream:
+    """Minimal stand-in for a messages.stream context manager."""
+
+    def __init__(self, response):
+        self.response = response
+        self.text_stream = [block.text for block in response.content if block.type == "text"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def get_final_message(self):
+        return self.response
+
+
+class ScriptedMessages:
+    """Returns canned prep-loop responses in order, streamed or not."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return ScriptedStream(self.responses.pop(0))
+
+
+def _tool_use(tool_id: str, name: str, tool_input: dict) -> SimpleNamespace:
+    return SimpleNamespace(type="tool_use", id=tool_id, name=name, input=tool_input)
+
+
+def _turn(stop_reason: str, content: list, input_tokens: int = 1000) -> SimpleNamespace:
+    usage = SimpleNamespace(input_tokens=input_tokens, cache_read_input_tokens=None, cache_creation_input_tokens=None)
+    return SimpleNamespace(stop_reason=stop_reason, content=content, usage=usage)
+
+
+class TestPrepLoop:
+    def test_tool_results_are_compact_and_in_request_order(self, agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        messages = ScriptedMessages(
+            [
+                _turn("tool_use", [_tool_use("t1", "read_prep", {}), _tool_use("t2", "bogus", {})]),
+                _turn("end_turn", [SimpleNamespace(type="text", text="Done")]),
+            ]
+        )
+        agent.client = SimpleNamespace(messages=messages)
+
+        agent.prep(max_turns=2, stream=False)
+
+        tool_results = messages.calls[1]["messages"][2]["content"]
+        assert [r["tool_use_id"] for r in tool_results] == ["t1", "t2"]
+        assert tool_results[1]["content"] == '{"error":"Unknown tool: bogus"}'
+        assert "\n" not in tool_results[0]["content"]
+
+    def test_streamed_turn_prints_thinking_once(self, agent, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        messages = ScriptedMessages([_turn("end_turn", [SimpleNamespace(type="text", text="Thinking aloud")])])
+        agent.client = SimpleNamespace(messages=messages)
+
+        agent.prep(max_turns=1, stream=True)
+
+        assert capsys.readouterr().out.count("Thinking aloud") == 1
+
+    def test_old_tool_results_are_summarized(self, agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        turns = [_turn("tool_use", [_tool_use(f"t{i}", "read_prep", {})]) for i in range(4)]
+        messages = ScriptedMessages([*turns, _turn("end_turn", [])])
+        agent.client = SimpleNamespace(messages=messages)
+
+        agent.prep(max_turns=5)
+
+        history = messages.calls[-1]["messages"]
+        results = [m["content"][0] for m in history if m["role"] == "user" and isinstance(m["content"], list)]
+        assert [r["tool_use_id"] for r in results] == ["t0", "t1", "t2", "t3"]
+        assert results[0]["content"].startswith("[read_prep result summarized")
+        assert "num_arguments=0" in results[0]["content"]
+        assert results[-1]["content"].startswith("{")
+
+    def test_large_prompt_summarizes_all_but_newest_results(self, agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        turns = [
+            _turn("tool_use", [_tool_use("t0", "read_prep", {})]),
+            _turn("tool_use", [_tool_use("t1", "read_prep", {})], input_tokens=160_000),
+            _turn("end_turn", []),
+        ]
+        messages = ScriptedMessages(turns)
+        agent.client = SimpleNamespace(messages=messages)
+
+        agent.prep(max_turns=3)
+
+        history = messages.calls[-1]["messages"]
+        results = [m["content"][0] for m in history if m["role"] == "user" and isinstance(m["content"], list)]
+        assert results[0]["content"].startswith("[read_prep result summarized")
+        assert results[1]["content"].startswith("{")
+
+    def test_prep_rereads_the_flat_debate_file(self, agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        agent._flat_file = FlatDebateFile(resolution=RESOLUTION)
+        agent.client = SimpleNamespace(messages=ScriptedMessages([_turn("end_turn", [])]))
+
+        agent.prep(max_turns=1)
+
+        assert agent._flat_file is None
+
+    def test_writer_is_closed_when_a_tool_raises(self, agent, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        closed = []
+
+        class RecordingWriter(debate_agent.FlatDebateFileWriter):
+            def close(self):
+                super().close()
+                closed.append(True)
+
+        monkeypatch.setattr(debate_agent, "FlatDebateFileWriter", RecordingWriter)
+        messages = ScriptedMessages([_turn("tool_use", [_tool_use("t0", "analyze", {"analysis_type": "bogus"})])])
+        agent.client = SimpleNamespace(messages=messages)
+
+        with pytest.raises(ValueError):
+            agent.prep(max_turns=1)
+
+        assert closed == [True]
+        assert agent._flat_writer is None
+
+    def test_session_fetch_files_are_deleted_when_prep_ends(self, agent, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(debate_agent.trafilatura, "fetch_url", lambda url: "<html></html>")
+        monkeypatch.setattr(debate_agent, "extract_article_text", lambda html, **kwargs: "Article text.")
+        fetch = _tool_use("t0", "fetch_source", {"url": "https://example.com/a"})
+        agent.client = SimpleNamespace(messages=ScriptedMessages([_turn("tool_use", [fetch]), _turn("end_turn", [])]))
+
+        agent.prep(max_turns=2)
+
+        assert list(debate_agent.FETCH_CACHE_DIR.glob("*.txt")) == []
+        assert len(list((debate_agent.FETCH_CACHE_DIR / "urls").glob("*.txt"))) == 1
+        assert agent.fetched_sources == {}
+
+    def test_parallel_analyses_print_in_request_order_without_streaming(self, agent, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+
+        class AnalysisMessages(ScriptedMessages):
+            def create(self, **kwargs):
+                if "tools" in kwargs:
+                    return super().create(**kwargs)
+                text = "tree" if "ARGUMENT TREE" in kwargs["messages"][0]["content"] else "branches"
+                return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+            def stream(self, **kwargs):
+                assert "tools" in kwargs, "analysis must not stream from a worker"
+                return super().stream(**kwargs)
+
+        analyses = [
+            _tool_use("t0", "analyze", {"analysis_type": "breadcrumb_initial"}),
+            _tool_use("t1", "analyze", {"analysis_type": "breadcrumb_followup"}),
+        ]
+        messages = AnalysisMessages([_turn("tool_use", analyses), _turn("end_turn", [])])
+        agent.client = SimpleNamespace(messages=messages)
+
+        agent.prep(max_turns=2)
+
+        out = capsys.readouterr().out
+        assert out.index("Analysis (breadcrumb_initial):\ntree") < out.index(
+            "Analysis (breadcrumb_followup):\nbranches"
+        )
+
+    def test_card_cuts_run_one_at_a_time_in_request_order(self, agent, tmp_path, monkeypatch):
+        import threading
+
+        monkeypatch.chdir(tmp_path)
+        order = []
+
+        def fake_cut_cards(cuts):
+            order.append((cuts[0]["tag"], threading.current_thread() is threading.main_thread()))
+            return {"status": "success", "cards_cut": 1, "results": []}
+
+        monkeypatch.setattr(agent, "_cut_cards_skill", fake_cut_cards)
+        calls = [_tool_use(f"t{i}", "cut_cards", {"cuts": [{"tag": f"Card {i}"}]}) for i in range(3)]
+        agent.client = SimpleNamespace(messages=ScriptedMessages([_turn("tool_use", calls), _turn("end_turn", [])]))
+
+        agent.prep(max_turns=2)
+
+        assert order == [("Card 0", True), ("Card 1", True), ("Card 2", True)]
+
+
+class TestFetchSourceSkill:
+    def test_refetching_a_url_reuses_the_cached_text(self, agent, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        downloads = []
+        monkeypatch.setattr(debate_agent.trafilatura, "fetch_url", lambda url: downloads.append(url) or "<html></html>")
+        monkeypatch.setattr(debate_agent, "extract_article_text", lambda html, **kwargs: "Article text. " * 500)
+
+        first = agent._fetch_source_skill("https://example.com/a")
+        second = agent._fetch_source_skill("https://example.com/a")
+
+        assert downloads == ["https://example.com/a"]
+        assert first["status"] == second["status"] == "success"
+        assert first["preview"] == second["preview"]
+
+
+class TestUrlCache:
+    def test_round_trip_keeps_line_endings(self, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        debate_agent._write_cached_url("https://example.com", "a\r\nb\n")
+
+        assert debate_agent._read_cached_url("https://example.com") == "a\r\nb\n"
+        assert [p.suffix for p in debate_agent._URL_CACHE_DIR.iterdir()] == [".txt"]
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        debate_agent._write_cached_url("https://example.com", "text")
+        debate_agent._url_cache_path("https://example.com").write_bytes(b"\xff\xfe truncated")
+
+        assert debate_agent._read_cached_url("https://example.com") is None
+
+
+class TestUrlCachePruning:
+    def test_expired_and_oldest_entries_are_deleted(self, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        now = time.time()
+        ages = {"expired": debate_agent._URL_CACHE_TTL_SECONDS + 60, "old": 300, "new": 0}
+        for url, age in ages.items():
+            debate_agent._write_cached_url(url, "x" * 100)
+            os.utime(debate_agent._url_cache_path(url), (now - age, now - age))
+        monkeypatch.setattr(debate_agent, "_URL_CACHE_MAX_BYTES", 150)
+
+        debate_agent._prune_url_cache()
+
+        assert [url for url in ages if debate_agent._url_cache_path(url).exists()] == ["new"]
+
+    def test_missing_cache_dir(self, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        debate_agent._prune_url_cache()
+
+
+class TestResearchSkill:
+    def test_card_in_several_sections_counts_once(self, agent, tmp_path, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        monkeypatch.chdir(tmp_path)
+        researched = DebateFile(resolution=RESOLUTION)
+        card = Card(tag="Creators", author="Jane Doe", credentials="c", year="2024", source="s", text="x")
+        researched.add_card(card)
+        researched.add_to_section(Side.CON, SectionType.SUPPORT, "Creator economy", card.id)
+        researched.add_to_section(Side.CON, SectionType.IMPACT, "Creator economy harms", card.id)
+        monkeypatch.setattr(debate_agent, "_research_evidence", lambda **kwargs: researched)
+
+        result = agent._research_skill("creator economy", "support", num_cards=2, stream=False)
+
+        assert result["cards_cut_from_web"] == 1
+        assert result["total_cards"] == 1
+
+
+class TestCaseCache:
+    def test_identical_case_request_is_generated_once(self, agent, monkeypatch):
+        import debate.debate_agent as debate_agent
+
+        calls = []
+
+        def fake_generate_case(**kwargs):
+            calls.append(kwargs)
+            return _case(Side.CON)
+
+        monkeypatch.setattr(debate_agent, "_generate_case", fake_generate_case)
+        debate_file = DebateFile(resolution=RESOLUTION)
+        card = Card(tag="Creators", author="Jane Doe", credentials="c", year="2024", source="s", text="x")
+        debate_file.add_card(card)
+        debate_file.add_to_section(Side.CON, SectionType.SUPPORT, "Creator economy", card.id)
+
+        first = agent.generate_case(debate_file, stream=False)
+        second = agent.generate_case(debate_file, stream=False)
+        assert len(calls) == 1
+        assert first == second
+
+        agent.generate_case(stream=False)
+        assert len(calls) == 2
+
+        agent.clear_cache()
+        agent.generate_case(debate_file, stream=False)
+        assert len(calls) == 3
+
+
+class SnapshotMessages(ScriptedMessages):
+    """ScriptedMessages that also copies each request's messages as they were sent."""
+
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.sent = []
+
+    def stream(self, **kwargs):
+        self.sent.append(copy.deepcopy(kwargs["messages"]))
+        return super().stream(**kwargs)
+
+
+def _breakpoint(messages: list[dict]) -> tuple[int, int] | None:
+    """(message, block) index of the transcript's cache breakpoint, or None if there is none."""
+    for i, message in enumerate(messages):
+        if isinstance(message["content"], list):
+            for j, block in enumerate(message["content"]):
+                if isinstance(block, dict) and "cache_control" in block:
+                    return i, j
+    return None
+
+
+def _prefix_bytes(messages: list[dict], breakpoint: tuple[int, int]) -> str:
+    """Serialize messages up to and including the breakpoint block, ignoring where breakpoints sit."""
+    i, j = breakpoint
+    prefix = [*messages[:i], {**messages[i], "content": messages[i]["content"][: j + 1]}]
+    prefix = copy.deepcopy(prefix)
+    for message in prefix:
+        if isinstance(message["content"], list):
+            for block in message["content"]:
+                if isinstance(block, dict):
+                    block.pop("cache_control", None)
+    return json.dumps(prefix, default=vars)
+
+
+class TestPrepPromptCaching:
+    def test_system_and_newest_summarized_result_are_cache_breakpoints(self, agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        turns = [_turn("tool_use", [_tool_use(f"t{i}", "read_prep", {})]) for i in range(3)]
+        messages = ScriptedMessages([*turns, _turn("end_turn", [])])
+        agent.client = SimpleNamespace(messages=messages)
+
+        agent.prep(max_turns=4)
+
+        last_call = messages.calls[-1]
+        assert last_call["system"][0]["cache_control"] == {"type": "ephemeral"}
+        results = [
+            m["content"][0] for m in last_call["messages"] if m["role"] == "user" and isinstance(m["content"], list)
+        ]
+        assert [("cache_control" in r) for r in results] == [True, False, False]
+        assert results[0]["content"].startswith("[read_prep result summarized")
+
+    def test_consecutive_turns_share_the_cached_transcript_prefix(self, agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        turns = [_turn("tool_use", [_tool_use(f"t{i}", "read_prep", {})]) for i in range(6)]
+        messages = SnapshotMessages([*turns, _turn("end_turn", [])])
+        agent.client = SimpleNamespace(messages=messages)
+
+        agent.prep(max_turns=7)
+
+        breakpoints = [_breakpoint(sent) for sent in messages.sent]
+        cached = [i for i, bp in enumerate(breakpoints) if bp is not None]
+        assert len(cached) >= 3
+        for i in cached[:-1]:
+            assert _prefix_bytes(messages.sent[i + 1], breakpoints[i]) == _prefix_bytes(
+                messages.sent[i], breakpoints[i]
+            )
+            assert breakpoints[i + 1] > breakpoints[i]
+
+
+class TestSpeechContextBudget:
+    def _add_speeches(self, round_state, count, words):
+        for i in range(count):
+            round_state.speeches.append(
+                Speech(
+                    speech_type=SpeechType.REBUTTAL,
+                    side=Side.PRO if i % 2 == 0 else Side.CON,
+                    speaker_number=1,
+                    content=f"speech{i} " + "word " * words,
+                    time_limit_seconds=240,
+                )
+            )
+
+    def test_short_round_is_sent_verbatim(self, agent, round_state):
+        self._add_speeches(round_state, 4, words=100)
+
+        agent.generate_speech("Summary goal", round_state, 180, stream=False)
+
+        calls = agent.client.messages.calls
+        assert len(calls) == 1
+        assert "speech2 word" in calls[0]["messages"][0]["content"]
+
+    def test_long_round_summarizes_middle_speeches_once(self, agent, round_state):
+        self._add_speeches(round_state, 4, words=5000)
+
+        agent.generate_speech("Final focus goal", round_state, 120, stream=False)
+        agent.generate_speech("Final focus goal", round_state, 120, stream=False)
+
+        calls = agent.client.messages.calls
+        assert len(calls) == 3  # one summary, two speeches
+        assert "speech1 word" in calls[0]["messages"][0]["content"]
+        speech_prompt = calls[1]["messages"][0]["content"]
+        assert "Speeches 2-3: Summary" in speech_prompt
+        assert "speech0 word" in speech_prompt
+        assert "speech3 word" in speech_prompt
+        assert "speech1 word" not in speech_prompt
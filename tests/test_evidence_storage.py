@@ -0,0 +1,347 @@
+"""Tests for debate file storage."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from debate.evidence_storage import (
+    FLAT_JOURNAL_NAME,
+    FlatDebateFileWriter,
+    append_flat_debate_cards,
+    find_evidence_bucket,
+    get_resolution_dir,
+    list_debate_files,
+    list_evidence_buckets,
+    load_debate_file,
+    load_evidence_bucket,
+    load_flat_debate_file,
+    sanitize_filename,
+    save_debate_file,
+    save_evidence_bucket,
+    save_flat_debate_file,
+)
+from debate.models import ArgumentFile, Card, DebateFile, EvidenceBucket, FlatDebateFile, SectionType, Side
+
+RESOLUTION = "Resolved: The US should ban TikTok"
+
+
+def _card(tag: str) -> Card:
+    return Card(
+        tag=tag,
+        author="Jane Doe",
+        credentials="Professor of Law",
+        year="2024",
+        source="Law Review",
+        text=f"Evidence text for {tag}.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def evidence_root(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+class TestSanitizeFilename:
+    def test_replaces_separators_and_drops_punctuation(self):
+        assert (
+            sanitize_filename("Resolved: The U.S. should ban TikTok/apps") == "resolved_the_us_should_ban_tiktok_apps"
+        )
+        assert sanitize_filename('It\'s a "big" deal, really') == "its_a_big_deal_really"
+        assert sanitize_filename("  spaced  out  ") == "spaced_out"
+        assert sanitize_filename("x" * 100, max_length=10) == "x" * 10
+
+    def test_already_safe_slugs_pass_through(self):
+        assert sanitize_filename("tiktok_ban-2024") == "tiktok_ban-2024"
+        assert sanitize_filename("_edge_") == "edge"
+        assert sanitize_filename("double__under") == "double_under"
+        assert sanitize_filename("Upper_case") == "upper_case"
+
+
+class TestJsonRoundTrip:
+    def test_debate_file(self):
+        debate_file = DebateFile(resolution=RESOLUTION)
+        card = _card("Économie – “quoted”")
+        debate_file.add_card(card)
+        debate_file.add_to_section(Side.PRO, SectionType.SUPPORT, "Economy", card.id)
+
+        save_debate_file(debate_file)
+
+        assert load_debate_file(RESOLUTION) == debate_file
+
+    def test_failed_save_leaves_previous_file_readable(self, monkeypatch):
+        import debate.evidence_storage as evidence_storage
+
+        debate_file = DebateFile(resolution=RESOLUTION)
+        debate_file.add_card(_card("Economy"))
+        save_debate_file(debate_file)
+
+        def crash(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(evidence_storage.os, "replace", crash)
+        debate_file.add_card(_card("Jobs"))
+        with pytest.raises(OSError):
+            save_debate_file(debate_file)
+
+        assert len(load_debate_file(RESOLUTION).cards) == 1
+
+    def test_evidence_bucket(self):
+        bucket = EvidenceBucket(topic="Economy", resolution=RESOLUTION, side=Side.CON, cards=[_card("Jobs")])
+
+        assert load_evidence_bucket(save_evidence_bucket(bucket)) == bucket
+
+    def test_find_evidence_bucket(self):
+        bucket = EvidenceBucket(topic="Economy", resolution=RESOLUTION, side=Side.CON, cards=[_card("Jobs")])
+        save_evidence_bucket(bucket)
+
+        assert find_evidence_bucket(RESOLUTION, Side.CON, "Economy") == bucket
+        assert find_evidence_bucket(RESOLUTION, Side.PRO, "Economy") is None
+
+    def test_flat_debate_file(self):
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        arg = ArgumentFile(title="Economy", purpose="Costs", is_answer=True, answers_to="Jobs")
+        arg.find_or_create_semantic_group("Économie").add_card(_card("Économie – “quoted”"))
+        flat_file.add_argument(Side.CON, arg)
+
+        save_flat_debate_file(flat_file)
+        loaded = load_flat_debate_file(RESOLUTION)
+
+        assert loaded == flat_file
+        assert loaded.find_argument(Side.CON, "economy").get_filename() == arg.get_filename()
+
+    def test_legacy_flat_meta_format(self):
+        resolution_dir = get_resolution_dir(RESOLUTION)
+        legacy_arg = {"title": "Economy", "claims": [{"claim": "Jobs", "cards": [_card("Jobs").model_dump()]}]}
+        meta = {"resolution": RESOLUTION, "pro_arguments": [legacy_arg], "con_arguments": []}
+        (resolution_dir / ".flat_meta.json").write_text(json.dumps(meta))
+
+        loaded = load_flat_debate_file(RESOLUTION)
+
+        group = loaded.pro_arguments[0].semantic_groups[0]
+        assert group.semantic_category == "Jobs"
+        assert group.cards[0].tag == "Jobs"
+
+
+class TestListDebateFiles:
+    def test_unchanged_files_are_listed_without_reloading(self, monkeypatch):
+        import debate.evidence_storage as evidence_storage
+
+        debate_file = DebateFile(resolution=RESOLUTION)
+        card = _card("Economy")
+        debate_file.add_card(card)
+        debate_file.add_to_section(Side.PRO, SectionType.SUPPORT, "Economy", card.id)
+        save_debate_file(debate_file)
+        assert [f["num_cards"] for f in list_debate_files()] == [1]
+
+        def fail(resolution):
+            raise AssertionError("unchanged debate file was reloaded")
+
+        monkeypatch.setattr(evidence_storage, "load_debate_file", fail)
+        assert [f["num_cards"] for f in list_debate_files()] == [1]
+        monkeypatch.undo()
+
+        debate_file.add_card(_card("Jobs"))
+        save_debate_file(debate_file)
+        assert [f["num_cards"] for f in list_debate_files()] == [2]
+
+    def test_journaled_flat_cards_are_counted(self):
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        flat_file.add_argument(Side.PRO, arg)
+        save_flat_debate_file(flat_file)
+        assert [f["num_cards"] for f in list_debate_files()] == [0]
+
+        card = _card("Jobs")
+        arg.find_or_create_semantic_group("jobs").add_card(card)
+        append_flat_debate_cards(flat_file, [(Side.PRO, arg, "jobs", card)])
+        assert [f["num_cards"] for f in list_debate_files()] == [1]
+
+
+class TestListEvidenceBuckets:
+    def test_lists_and_filters_buckets(self):
+        save_evidence_bucket(EvidenceBucket(topic="Economy", resolution=RESOLUTION, side=Side.PRO, cards=[_card("a")]))
+        save_evidence_bucket(EvidenceBucket(topic="Privacy", resolution="Resolved: Other", side=Side.CON))
+        (get_resolution_dir(RESOLUTION).parent / "broken.json").write_text("{")
+
+        assert sorted(b["topic"] for b in list_evidence_buckets()) == ["Economy", "Privacy"]
+        assert [b["num_cards"] for b in list_evidence_buckets(resolution=RESOLUTION)] == [1]
+
+
+class TestIndexRewrite:
+    def test_unchanged_index_is_not_rewritten(self, monkeypatch):
+        import debate.evidence_storage as evidence_storage
+
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        flat_file.add_argument(Side.PRO, arg)
+        save_flat_debate_file(flat_file)
+
+        written = []
+        real_write = evidence_storage._write_text_atomic
+        monkeypatch.setattr(
+            evidence_storage,
+            "_write_text_atomic",
+            lambda path, text: (written.append(path.name), real_write(path, text)),
+        )
+        save_flat_debate_file(flat_file)
+        assert "INDEX.md" not in written
+
+        arg.find_or_create_semantic_group("Jobs").add_card(_card("Ban costs jobs"))
+        save_flat_debate_file(flat_file)
+        assert "INDEX.md" in written
+
+
+class TestWriteTextAtomic:
+    def test_concurrent_writers_leave_one_whole_file(self, tmp_path):
+        from debate.evidence_storage import _write_text_atomic
+
+        path = tmp_path / "meta.json"
+        texts = [str(i) * 10_000 for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda text: _write_text_atomic(path, text), texts))
+
+        assert path.read_text(encoding="utf-8") in texts
+        assert [p.name for p in tmp_path.iterdir()] == ["meta.json"]
+
+    def test_failed_write_keeps_old_file_and_removes_temp(self, tmp_path, monkeypatch):
+        import debate.evidence_storage as evidence_storage
+
+        path = tmp_path / "meta.json"
+        path.write_text("old", encoding="utf-8")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(evidence_storage.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            evidence_storage._write_text_atomic(path, "new")
+
+        assert path.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["meta.json"]
+
+
+class TestAppendFlatDebateCards:
+    def test_first_append_writes_full_snapshot(self):
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        flat_file.add_argument(Side.PRO, arg)
+        card = _card("Ban costs jobs")
+        arg.find_or_create_semantic_group(card.tag).add_card(card)
+
+        append_flat_debate_cards(flat_file, [(Side.PRO, arg, card.tag, card)])
+
+        resolution_dir = get_resolution_dir(RESOLUTION)
+        assert (resolution_dir / ".flat_meta.json").exists()
+        assert not (resolution_dir / FLAT_JOURNAL_NAME).exists()
+
+    def test_appended_cards_are_replayed_on_load(self):
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        save_flat_debate_file(flat_file)
+
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        flat_file.add_argument(Side.PRO, arg)
+        first, second = _card("Ban costs jobs"), _card("Ban hurts creators")
+        arg.find_or_create_semantic_group("Jobs").add_card(first)
+        append_flat_debate_cards(flat_file, [(Side.PRO, arg, "Jobs", first)])
+        arg.find_or_create_semantic_group("Jobs").add_card(second)
+        append_flat_debate_cards(flat_file, [(Side.PRO, arg, "Jobs", second)])
+
+        resolution_dir = get_resolution_dir(RESOLUTION)
+        assert (resolution_dir / FLAT_JOURNAL_NAME).exists()
+        assert (resolution_dir / "pro" / "economic_harm.md").exists()
+
+        loaded = load_flat_debate_file(RESOLUTION)
+        assert [a.title for a in loaded.pro_arguments] == ["Economic Harm"]
+        assert [c.id for c in loaded.pro_arguments[0].get_all_cards()] == [first.id, second.id]
+
+    def test_full_save_folds_journal_into_snapshot(self):
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        save_flat_debate_file(flat_file)
+
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        flat_file.add_argument(Side.PRO, arg)
+        card = _card("Ban costs jobs")
+        arg.find_or_create_semantic_group("Jobs").add_card(card)
+        append_flat_debate_cards(flat_file, [(Side.PRO, arg, "Jobs", card)])
+
+        save_flat_debate_file(flat_file)
+
+        assert not (get_resolution_dir(RESOLUTION) / FLAT_JOURNAL_NAME).exists()
+        loaded = load_flat_debate_file(RESOLUTION)
+        assert len(loaded.get_all_cards()) == 1
+
+    def test_fold_keeps_cards_appended_by_another_writer(self, monkeypatch):
+        import debate.evidence_storage as evidence_storage
+
+        save_flat_debate_file(FlatDebateFile(resolution=RESOLUTION))
+        ours, theirs = load_flat_debate_file(RESOLUTION), load_flat_debate_file(RESOLUTION)
+
+        their_arg = ArgumentFile(title="Security", purpose="Evidence")
+        theirs.add_argument(Side.CON, their_arg)
+        their_card = _card("Data risk")
+        their_arg.find_or_create_semantic_group("Data").add_card(their_card)
+        append_flat_debate_cards(theirs, [(Side.CON, their_arg, "Data", their_card)])
+
+        # Our stale copy forces a full save
+        monkeypatch.setattr(evidence_storage, "FLAT_JOURNAL_COMPACT_BYTES", 0)
+        our_arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        ours.add_argument(Side.PRO, our_arg)
+        our_card = _card("Ban costs jobs")
+        our_arg.find_or_create_semantic_group("Jobs").add_card(our_card)
+        append_flat_debate_cards(ours, [(Side.PRO, our_arg, "Jobs", our_card)])
+
+        assert not (get_resolution_dir(RESOLUTION) / FLAT_JOURNAL_NAME).exists()
+        loaded = load_flat_debate_file(RESOLUTION)
+        assert {c.id for c in loaded.get_all_cards()} == {their_card.id, our_card.id}
+
+    def test_journal_left_behind_by_interrupted_fold_is_not_replayed_twice(self, monkeypatch):
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        save_flat_debate_file(flat_file)
+
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        flat_file.add_argument(Side.PRO, arg)
+        card = _card("Ban costs jobs")
+        arg.find_or_create_semantic_group("Jobs").add_card(card)
+        append_flat_debate_cards(flat_file, [(Side.PRO, arg, "Jobs", card)])
+
+        # Crash after the snapshot is written but before the journal is removed
+        monkeypatch.setattr(Path, "unlink", lambda self, missing_ok=False: None)
+        save_flat_debate_file(flat_file)
+        assert (get_resolution_dir(RESOLUTION) / FLAT_JOURNAL_NAME).exists()
+
+        loaded = load_flat_debate_file(RESOLUTION)
+        assert [c.id for c in loaded.get_all_cards()] == [card.id]
+
+
+class TestFlatDebateFileWriter:
+    def test_writes_coalesce_and_flush(self):
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        save_flat_debate_file(flat_file)
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        flat_file.add_argument(Side.PRO, arg)
+
+        writer = FlatDebateFileWriter()
+        cards = [_card(f"Card {i}") for i in range(5)]
+        for card in cards:
+            arg.find_or_create_semantic_group("Jobs").add_card(card)
+            writer.submit(flat_file, [(Side.PRO, arg, "Jobs", card)])
+        writer.close()
+
+        loaded = load_flat_debate_file(RESOLUTION)
+        assert [c.id for c in loaded.get_all_cards()] == [c.id for c in cards]
+
+    def test_flush_reraises_write_errors(self, monkeypatch):
+        import debate.evidence_storage as storage
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage, "append_flat_debate_cards", fail)
+        flat_file = FlatDebateFile(resolution=RESOLUTION)
+        writer = FlatDebateFileWriter()
+        writer.submit(flat_file, [])
+        with pytest.raises(OSError):
+            writer.flush()
+        writer.close()
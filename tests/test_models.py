@@ -3,9 +3,12 @@
 import pytest
 
 from debate.models import (
+    ArgumentFile,
     Card,
     Case,
     Contention,
+    DebateFile,
+    FlatDebateFile,
     Side,
     Speech,
     SpeechType,
@@ -55,6 +58,17 @@ class TestCard:
         assert "Journal of Economic Perspectives" in formatted
         assert "https://example.com/article" in formatted
 
+    def test_last_name(self):
+        card = Card(tag="t", author="John Smith", credentials="c", year="2024", source="s", text="x")
+        assert card.last_name == "Smith"
+        assert "last_name" not in card.model_dump()
+
+        card.author = "Jane Doe"
+        assert card.last_name == "Doe"
+
+        card.author = ""
+        assert card.last_name == ""
+
 
 class TestContention:
     def test_creation(self):
@@ -114,6 +128,24 @@ class TestCase:
         formatted = case.format()
         assert "NEGATIVE CASE" in formatted
 
+    def test_format_is_reused_until_case_changes(self):
+        case = Case(
+            resolution="Resolved: Test",
+            side=Side.PRO,
+            contentions=[
+                Contention(title="Contention 1: Test", content="Test content"),
+                Contention(title="Contention 2: Test", content="More content"),
+            ],
+        )
+        first = case.format()
+        assert case.format() is first
+
+        case.contentions[1].content = "Edited content"
+        assert "Edited content" in case.format()
+
+        case.side = Side.CON
+        assert "NEGATIVE CASE" in case.format()
+
     def test_min_contentions_validation(self):
         """Case must have at least 2 contentions."""
         with pytest.raises(ValueError):
@@ -161,3 +193,44 @@ class TestSpeech:
                 content="Content",
                 time_limit_seconds=240,
             )
+
+
+class TestArgumentFile:
+    def test_cached_keys(self):
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        assert arg.title_casefold == "economic harm"
+        assert arg.answers_to_casefold is None
+        assert arg.get_filename() == "economic_harm.md"
+
+    def test_cached_keys_refresh_on_assignment(self):
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        arg.is_answer = True
+        arg.answers_to = "Privacy Concerns"
+        assert arg.answers_to_casefold == "privacy concerns"
+        assert arg.get_filename() == "at_privacy_concerns.md"
+
+    def test_cached_keys_survive_round_trip(self):
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        restored = ArgumentFile.model_validate(arg.model_dump())
+        assert restored.get_filename() == "economic_harm.md"
+
+
+class TestGetCards:
+    def _card(self, tag: str) -> Card:
+        return Card(tag=tag, author="Jane Doe", credentials="c", year="2024", source="s", text="x")
+
+    def test_debate_file(self):
+        debate_file = DebateFile(resolution="r")
+        first, second = self._card("one"), self._card("two")
+        debate_file.add_card(first)
+        debate_file.add_card(second)
+        assert debate_file.get_cards([second.id, "missing", first.id]) == [second, None, first]
+
+    def test_flat_debate_file(self):
+        flat_file = FlatDebateFile(resolution="r")
+        arg = ArgumentFile(title="Economic Harm", purpose="Evidence")
+        first, second = self._card("one"), self._card("two")
+        arg.find_or_create_semantic_group("jobs").add_card(first)
+        arg.find_or_create_semantic_group("growth").add_card(second)
+        flat_file.add_argument(Side.PRO, arg)
+        assert flat_file.get_cards([second.id, "missing", first.id]) == [second, None, first]
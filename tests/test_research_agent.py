@@ -0,0 +1,28 @@
+"""Tests for research agent helpers."""
+
+import debate.research_agent as research_agent
+
+
+class TestBraveRateLimit:
+    def test_waits_only_for_the_rest_of_the_interval(self, monkeypatch):
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(research_agent.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(research_agent.time, "sleep", fake_sleep)
+        monkeypatch.setattr(research_agent, "_brave_last_call", 0.0)
+
+        research_agent._wait_for_brave_slot()
+        assert sleeps == []
+
+        clock[0] += 0.25
+        research_agent._wait_for_brave_slot()
+        assert sleeps == [research_agent._BRAVE_MIN_INTERVAL - 0.25]
+
+        clock[0] += 5.0
+        research_agent._wait_for_brave_slot()
+        assert len(sleeps) == 1
@@ -0,0 +1,41 @@
+"""Tests for RoundController speech flow."""
+
+import threading
+import time
+
+import pytest
+
+from debate.models import Side
+from debate.round_controller import RoundController
+
+RESOLUTION = "Resolved: The US should ban TikTok"
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    return RoundController(resolution=RESOLUTION, user_side=Side.PRO)
+
+
+class TestBackgroundCase:
+    def test_interrupt_does_not_wait_for_background_case(self, controller):
+        release = threading.Event()
+
+        def slow_case(side, stream=True):
+            release.wait(timeout=10)
+
+        def interrupted_speech(speech_type, speaker_num, time_seconds):
+            raise KeyboardInterrupt
+
+        controller._generate_case = slow_case
+        controller._user_speech = interrupted_speech
+
+        started = time.monotonic()
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                controller.run_round()
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        assert elapsed < 2